@@ -7,7 +7,8 @@ All modules import exclusively from here; no magic numbers appear elsewhere.
 
 Environment overrides
 ---------------------
-Every field reads from an env variable of the same name (loaded via os.getenv).
+Every field reads from an env variable of the same name. The environment is
+read exactly once, by _Config.from_env(), when this module is first imported.
 Set them in .env or export them in the shell before starting the pipeline.
 
 Inspecting the current config
@@ -15,58 +16,107 @@ Inspecting the current config
     python -m src.config
 """
 
+import fnmatch
 import json
 import logging
 import os
+import re
 import time
-from dataclasses import asdict, dataclass, field
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from typing import Any
+
+try:  # orjson is optional; it decodes the JSON env fields 2-5x faster.
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# ---------------------------------------------------------------------------
+# JSON defaults — parsed once at import, shared by every from_env() call
+# ---------------------------------------------------------------------------
+
+_DEFAULT_SENSOR_VALUE_RANGE: dict = _json_loads(
+    '{"*ph*": [0.0, 14.0], "*turbidity*": [0.0, 1000.0], "*flow*": [0.0, 10000.0], "*": [-1.0e9, 1.0e9]}'
+)
+_DEFAULT_RIVER_SENSITIVITY: dict = _json_loads(
+    '{"discharge_point_A": 3.5, "discharge_point_B": 1.2}'
+)
+_DEFAULT_SENSOR_GROUPS: dict = _json_loads(
+    '{"discharge_point_A": ["FACTORY_A", "FACTORY_B", "FACTORY_C", "FACTORY_D"]}'
+)
+
+
+# ERI risk bands in ascending severity. Alert gates compare these integer
+# ranks (RISK_BAND_RANK[row_band] >= CONFIG.alert_min_risk_band_rank)
+# instead of comparing band strings per row.
+RISK_BAND_RANK: Mapping[str, int] = MappingProxyType(
+    {"LOW": 0, "MEDIUM": 1, "HIGH": 2, "CRITICAL": 3}
+)
+
+
+def _json_env(env: Mapping[str, str], key: str, default: dict) -> dict:
+    """Return the JSON-decoded value of env[key], or default when the key is unset."""
+    raw = env.get(key)
+    return default if raw is None else _json_loads(raw)
+
+
+def _compile_value_ranges(
+    ranges: object,
+) -> tuple[tuple[re.Pattern[str], float, float], ...]:
+    """Compile sensor_value_range globs into (regex, min, max) tuples, in dict order.
+
+    Malformed entries are skipped here; validate_config() reports them.
+    """
+    if not isinstance(ranges, dict):
+        return ()
+    return tuple(
+        (re.compile(fnmatch.translate(pattern)), bounds[0], bounds[1])
+        for pattern, bounds in ranges.items()
+        if isinstance(bounds, list) and len(bounds) == 2
+    )
 
 
 # ---------------------------------------------------------------------------
 # Config dataclass
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _Config:
-    """Immutable runtime configuration for the ShieldAI pipeline."""
+    """Immutable runtime configuration for the ShieldAI pipeline.
+
+    Build instances with _Config.from_env(); the fields below carry no
+    defaults so the environment is the single place they come from.
+    """
 
     # ------------------------------------------------------------------
     # Z-score anomaly scoring (zscore.py)
     # ------------------------------------------------------------------
 
-    window_seconds: int = field(
-        default_factory=lambda: int(os.getenv("WINDOW_SECONDS", "300"))
-    )
+    window_seconds: int
     # Trailing window width for per-sensor rolling mean/std.
     # Valid range: >= 10 (shorter windows give unstable stats).
     # NOTE: superseded by window_duration_ms for windowed_stats.py;
     # kept for backward compatibility with alert_cooldown and test fixtures.
 
-    window_duration_ms: int = field(
-        default_factory=lambda: int(os.getenv("WINDOW_DURATION_MS", "30000"))
-    )
+    window_duration_ms: int
     # Sliding-window duration in milliseconds for windowed_stats.py.
     # Controls the length of each sliding window (how much history is visible).
     # Valid range: > window_hop_ms.
     # Default: 30 000 ms (30 seconds) — tuned for 1-minute factory CSV cadence.
 
-    window_hop_ms: int = field(
-        default_factory=lambda: int(os.getenv("WINDOW_HOP_MS", "5000"))
-    )
+    window_hop_ms: int
     # Sliding-window hop in milliseconds for windowed_stats.py.
     # Controls how frequently a new window is emitted.
     # Valid range: >= 1 and < window_duration_ms.
     # Default: 5 000 ms (5 seconds).
 
-    zscore_threshold: float = field(
-        default_factory=lambda: float(os.getenv("ZSCORE_THRESHOLD", "3.0"))
-    )
+    zscore_threshold: float
     # |z-score| above which a reading is flagged as anomalous.
     # Valid range: > 0.0 (industry convention: 2.5–4.0).
 
-    epsilon: float = field(
-        default_factory=lambda: float(os.getenv("EPSILON", "1e-9"))
-    )
+    epsilon: float
     # Denominator floor added to rolling_std to prevent zero-division.
     # Valid range: > 0.0 and < 1e-6 (must be negligibly small).
 
@@ -74,9 +124,7 @@ class _Config:
     # Persistence filter (persistence.py)
     # ------------------------------------------------------------------
 
-    persistence_count: int = field(
-        default_factory=lambda: int(os.getenv("PERSISTENCE_COUNT", "3"))
-    )
+    persistence_count: int
     # Consecutive anomalous readings required before emitting a confirmed alert.
     # Valid range: >= 1.
 
@@ -84,36 +132,32 @@ class _Config:
     # Alert gating
     # ------------------------------------------------------------------
 
-    alert_cooldown_seconds: int = field(
-        default_factory=lambda: int(os.getenv("ALERT_COOLDOWN_SECONDS", "60"))
-    )
+    alert_cooldown_seconds: int
     # Minimum gap between successive alerts for the same sensor.
     # Prevents alert floods on sustained anomalies.
     # Valid range: >= 0 (0 = no cooldown).
 
-    alert_min_risk_band: str = field(
-        default_factory=lambda: os.getenv("ALERT_MIN_RISK_BAND", "MEDIUM").upper()
-    )
+    alert_min_risk_band: str
     # Minimum ERI risk band required to emit an alert.
     # Alerts below this band are silently suppressed.
     # Valid values: LOW, MEDIUM, HIGH, CRITICAL.
 
-    metrics_log_interval_seconds: int = field(
-        default_factory=lambda: int(os.getenv("METRICS_LOG_INTERVAL_SECONDS", "30"))
-    )
+    metrics_log_interval_seconds: int
     # How often (seconds) a latency summary line is printed by MetricsReporter.
     # Valid range: >= 1.
 
-    metrics_emit_interval_seconds: int = field(
-        default_factory=lambda: int(os.getenv("METRICS_EMIT_INTERVAL_SECONDS", "10"))
-    )
+    metrics_emit_interval_seconds: int
     # How often (seconds) the pipeline_metrics table is re-computed and emitted.
     # Default: 10 seconds.
     # Valid range: >= 1.
 
-    metrics_output_path: str = field(
-        default_factory=lambda: os.getenv("METRICS_OUTPUT_PATH", "data/alerts/pipeline_metrics.json")
-    )
+    timeline_ttl_seconds: int
+    # instrumentation.py drops per-event stage timestamps that have not
+    # reached the alert stage within this many seconds (events that never
+    # alert). Completed events are evicted immediately.
+    # Valid range: >= 1.
+
+    metrics_output_path: str
     # Path to the JSON file where real-time KPIs are written.
     # Must be a valid file path; directory will be created if missing.
 
@@ -123,9 +167,7 @@ class _Config:
     # Logging
     # ------------------------------------------------------------------
 
-    log_level: str = field(
-        default_factory=lambda: os.getenv("LOG_LEVEL", "INFO").upper()
-    )
+    log_level: str
     # Python logging level for the entire pipeline.
     # Valid values: DEBUG, INFO, WARNING, ERROR, CRITICAL.
 
@@ -133,40 +175,26 @@ class _Config:
     # Input schema / time format
     # ------------------------------------------------------------------
 
-    input_time_format: str = field(
-        default_factory=lambda: os.getenv("INPUT_TIME_FORMAT", "%Y-%m-%d %H:%M")
-    )
+    input_time_format: str
     # strptime/strftime format for the `time` column in all CSV sources.
     # Must match the format written by simulate_factories.py.
 
-    input_schema_sensor_column: str = field(
-        default_factory=lambda: os.getenv("INPUT_SCHEMA_SENSOR_COLUMN", "factory_id")
-    )
+    input_schema_sensor_column: str
     # Column name in factory CSVs that identifies the sensor / factory channel.
     # Valid values: any non-empty string matching CSV headers.
 
-    input_schema_value_column: str = field(
-        default_factory=lambda: os.getenv("INPUT_SCHEMA_VALUE_COLUMN", "cod")
-    )
+    input_schema_value_column: str
     # Column name carrying the primary measurement value used for z-scoring.
     # Valid values: cod, bod, ph, tss (must exist in factory CSV headers).
 
-    max_sensor_id_length: int = field(
-        default_factory=lambda: int(os.getenv("MAX_SENSOR_ID_LENGTH", "64"))
-    )
+    max_sensor_id_length: int
     # Maximum allowed length for a sensor_id string.
     # Valid range: >= 1.
 
-    sensor_value_range: dict = field(
-        default_factory=lambda: json.loads(
-            os.getenv(
-                "SENSOR_VALUE_RANGE",
-                '{"*ph*": [0.0, 14.0], "*turbidity*": [0.0, 1000.0], "*flow*": [0.0, 10000.0], "*": [-1.0e9, 1.0e9]}'
-            )
-        )
-    )
+    sensor_value_range: dict
     # Maps sensor_id glob patterns to [min, max] allowed values.
-    # Patterns are matched using fnmatch.
+    # Patterns use fnmatch syntax; the first matching pattern (dict order) wins.
+    # They are compiled once into sensor_value_range_compiled.
     # Valid values: dict; each value a [min, max] list where min < max.
 
 
@@ -174,40 +202,28 @@ class _Config:
     # Pathway I/O paths
     # ------------------------------------------------------------------
 
-    cetp_data_directory: str = field(
-        default_factory=lambda: os.getenv("CETP_DATA_DIR", "data/cetp")
-    )
+    cetp_data_directory: str
     # Directory containing cetp_clean.csv (output of simulate_factories.py).
 
-    factory_data_directory: str = field(
-        default_factory=lambda: os.getenv("FACTORY_DATA_DIR", "data/factories")
-    )
+    factory_data_directory: str
     # Directory containing factory_A/B/C/D.csv files.
 
-    alert_log_path: str = field(
-        default_factory=lambda: os.getenv("ALERT_LOG_PATH", "data/alerts/evidence_log.jsonl")
-    )
+    alert_log_path: str
     # Append-only JSONL file for Phase 1 alert evidence records.
 
-    tamper_log_path: str = field(
-        default_factory=lambda: os.getenv("TAMPER_LOG_PATH", "data/alerts/tamper_log.jsonl")
-    )
+    tamper_log_path: str
     # Append-only JSONL file written by the anti-cheat engine.
 
     # ------------------------------------------------------------------
     # Static threshold tripwire (tripwire.py — legacy Phase 1)
     # ------------------------------------------------------------------
 
-    cod_baseline: float = field(
-        default_factory=lambda: float(os.getenv("COD_BASELINE", "193.0"))
-    )
+    cod_baseline: float
     # Empirical CETP inlet COD mean (mg/L) from priya_cetp_i.csv (Feb 2026).
     # Used to compute breach_mag and classify HIGH vs MEDIUM alerts.
     # Valid range: > 0.0.
 
-    cod_threshold: float = field(
-        default_factory=lambda: float(os.getenv("COD_THRESHOLD", "200.0"))
-    )
+    cod_threshold: float
     # COD (mg/L) above which a CETP reading triggers a shock event.
     # Demo value: 200 mg/L. Production: raise to 450+ per regulatory limits.
     # Valid range: > cod_baseline.
@@ -216,44 +232,39 @@ class _Config:
     # Temporal backtracking (backtrack.py)
     # ------------------------------------------------------------------
 
-    pipe_travel_minutes: int = field(
-        default_factory=lambda: int(os.getenv("PIPE_TRAVEL_MINUTES", "15"))
-    )
+    pipe_travel_minutes: int
     # Fixed pipe travel time used to backtrack CETP events to factory discharge.
     # v1 constant; v2 will derive this dynamically from GIS + flow-rate sensors.
     # Valid range: >= 1.
 
-    asof_tolerance_seconds: int = field(
-        default_factory=lambda: int(os.getenv("ASOF_TOLERANCE_SECONDS", "120"))
-    )
+    asof_tolerance_seconds: int
     # Half-width of the temporal search window for asof_join attribution (±seconds).
     # Valid range: >= 1.
 
+    attribution_bucket_seconds: int
+    # alert.py memoises attribute_event() per CETP time rounded down to this
+    # bucket, so bursts of shock events in one bucket share one lookup (made
+    # with the first event time seen in the bucket).
+    # Must not exceed asof_tolerance_seconds.
+    # Valid range: >= 0 (0 = key on the exact event time, no rounding).
+
     # ------------------------------------------------------------------
     # Anti-cheat engine (anti_cheat.py)
     # ------------------------------------------------------------------
 
-    zero_variance_minutes: int = field(
-        default_factory=lambda: int(os.getenv("ZERO_VARIANCE_MINUTES", "5"))
-    )
+    zero_variance_minutes: int
     # Tumbling window width for zero-variance (frozen sensor) detection.
     # Valid range: >= 1.
 
-    cod_drop_fraction: float = field(
-        default_factory=lambda: float(os.getenv("COD_DROP_FRACTION", "0.80"))
-    )
+    cod_drop_fraction: float
     # COD must drop by at least this fraction vs the prior window to flag dilution.
     # Valid range: 0.0 < value < 1.0.
 
-    tss_stable_fraction: float = field(
-        default_factory=lambda: float(os.getenv("TSS_STABLE_FRACTION", "0.20"))
-    )
+    tss_stable_fraction: float
     # TSS must stay within (1 - tss_stable_fraction) of the prior window mean.
     # Valid range: 0.0 < value < 1.0.
 
-    blackout_min_minutes: int = field(
-        default_factory=lambda: int(os.getenv("BLACKOUT_MIN_MINUTES", "10"))
-    )
+    blackout_min_minutes: int
     # Minimum window length for guilt-by-disconnection blackout detection.
     # Valid range: >= 1.
 
@@ -261,58 +272,112 @@ class _Config:
     # Integrations
     # ------------------------------------------------------------------
 
-    shield_webhook_url: str = field(
-        default_factory=lambda: os.getenv("SHIELD_WEBHOOK_URL", "")
-    )
+    shield_webhook_url: str
     # HTTP(S) URL for alert webhook POST. Leave empty to disable.
     # Valid values: empty string (disabled) or a valid http/https URL.
 
+    webhook_max_retries: int
+    # Extra delivery attempts after a webhook POST fails with a transport
+    # error or HTTP 429/500/502/503/504. Backoff is exponential with full
+    # jitter, capped at webhook_backoff_max_seconds.
+    # Valid range: >= 0 (0 = single attempt, no retry).
+
+    webhook_backoff_max_seconds: float
+    # Upper bound on the sleep between two webhook retries.
+    # Valid range: > 0.
+
+    webhook_cb_threshold: int
+    # Consecutive failed webhook POSTs after which the circuit breaker opens
+    # and delivery is skipped (JSONL log only) for webhook_cb_cooldown_seconds.
+    # Valid range: >= 1.
+
+    webhook_cb_cooldown_seconds: float
+    # How long an open webhook circuit stays open before one probe POST is
+    # allowed through again.
+    # Valid range: > 0.
+
+    alert_dispatch_min_level: str
+    # Minimum alert_level that is pushed immediately (webhook POST, single
+    # email). Lower-level records are only logged and, for email, batched
+    # into a digest every email_batch_interval_seconds.
+    # Valid values: LOW, MEDIUM, HIGH, CRITICAL.
+
+    webhook_rate_per_second: float
+    # Sustained webhook POST rate allowed by the token bucket; records above
+    # the rate are logged but not POSTed.
+    # Valid range: > 0.
+
+    webhook_burst: int
+    # Token bucket capacity: POSTs allowed back-to-back before the rate
+    # limit applies.
+    # Valid range: >= 1.
+
+    email_batch_interval_seconds: float
+    # How long below-threshold records are collected before one digest email
+    # is sent for all of them.
+    # Valid range: > 0.
+
+    # ------------------------------------------------------------------
+    # Evidence log writer (alert.py)
+    # ------------------------------------------------------------------
+
+    alert_log_queue_size: int
+    # Maximum evidence records buffered between the Pathway callback and the
+    # background writer thread. When full, new records are dropped (and
+    # counted) rather than blocking the pipeline.
+    # Valid range: >= 1.
+
+    alert_log_flush_every_n: int
+    # The writer buffers encoded records in a 64 KiB BufferedWriter and
+    # flushes after this many records (or after alert_log_flush_interval_ms).
+    # Valid range: >= 1 (1 = flush every record).
+
+    alert_log_flush_interval_ms: int
+    # Upper bound on how long a buffered record may wait before it is
+    # flushed to the OS, even if fewer than alert_log_flush_every_n arrived.
+    # Valid range: >= 1.
+
+    alert_log_format: str
+    # On-disk encoding of the evidence log: "jsonl" (one JSON object per
+    # line) or "msgpack" (length-prefixed binary frames, smaller and faster
+    # to encode; requires the msgpack package). Convert msgpack logs for
+    # JSON tooling with tools/evidence_to_jsonl.py.
+    # Valid values: jsonl, msgpack.
+
+    alert_log_fsync_every: int
+    # fsync the evidence log after every N flushes (durability vs
+    # syscall cost). The log is always fsynced on shutdown.
+    # Valid range: >= 1.
+
     # ------------------------------------------------------------------
     # Environmental Risk Index — ERI (eri.py)
     # ------------------------------------------------------------------
 
-    river_sensitivity: dict = field(
-        default_factory=lambda: json.loads(
-            os.getenv(
-                "RIVER_SENSITIVITY",
-                '{"discharge_point_A": 3.5, "discharge_point_B": 1.2}',
-            )
-        )
-    )
+    river_sensitivity: dict
     # Maps discharge_point_id → sensitivity_factor (float).
     # Higher values indicate ecologically sensitive stretches of river.
     # Valid values: each factor in [1.0, 5.0].
     # Override via env: RIVER_SENSITIVITY='{"point_A": 3.5}' (JSON string).
 
-    default_sensitivity: float = field(
-        default_factory=lambda: float(os.getenv("DEFAULT_SENSITIVITY", "2.0"))
-    )
+    default_sensitivity: float
     # Sensitivity factor applied when a discharge_point_id is absent from
     # river_sensitivity. Sets unknown_sensitivity=True on those rows.
     # Valid range: 1.0 – 5.0.
 
-    severity_multiplier: float = field(
-        default_factory=lambda: float(os.getenv("SEVERITY_MULTIPLIER", "1.0"))
-    )
+    severity_multiplier: float
     # Global scaling factor applied to every ERI computation.
     # ERI = composite_score * sensitivity_factor * severity_multiplier.
     # Valid range: > 0.0.
 
-    eri_threshold_low: float = field(
-        default_factory=lambda: float(os.getenv("ERI_THRESHOLD_LOW", "2.0"))
-    )
+    eri_threshold_low: float
     # ERI below this value → risk_band = LOW.
     # Valid range: > 0.0 and < eri_threshold_medium.
 
-    eri_threshold_medium: float = field(
-        default_factory=lambda: float(os.getenv("ERI_THRESHOLD_MEDIUM", "5.0"))
-    )
+    eri_threshold_medium: float
     # ERI in [eri_threshold_low, eri_threshold_medium) → MEDIUM.
     # Valid range: > eri_threshold_low and < eri_threshold_high.
 
-    eri_threshold_high: float = field(
-        default_factory=lambda: float(os.getenv("ERI_THRESHOLD_HIGH", "10.0"))
-    )
+    eri_threshold_high: float
     # ERI in [eri_threshold_medium, eri_threshold_high) → HIGH.
     # ERI ≥ eri_threshold_high → CRITICAL.
     # Valid range: > eri_threshold_medium.
@@ -321,46 +386,190 @@ class _Config:
     # Multivariate anomaly scoring (multivariate.py)
     # ------------------------------------------------------------------
 
-    sensor_groups: dict = field(
-        default_factory=lambda: json.loads(
-            os.getenv(
-                "SENSOR_GROUPS",
-                '{"discharge_point_A": ["FACTORY_A", "FACTORY_B", "FACTORY_C", "FACTORY_D"]}',
-            )
-        )
-    )
+    sensor_groups: dict
     # Maps group names to ordered lists of sensor_ids that form the group.
     # Each sensor_id must match values in the input stream’s sensor_id column.
     # Override via env: SENSOR_GROUPS='{"group": ["s1","s2"]}' (JSON string).
     # Valid values: non-empty dict; each value a non-empty list of strings.
 
-    group_threshold: float = field(
-        default_factory=lambda: float(os.getenv("GROUP_THRESHOLD", "2.5"))
-    )
+    group_threshold: float
     # RMS z-score above which a sensor group reading is flagged as a group anomaly.
     # Valid range: > 0.0.
 
-    sync_tolerance_ms: int = field(
-        default_factory=lambda: int(os.getenv("SYNC_TOLERANCE_MS", "5000"))
-    )
+    sync_tolerance_ms: int
     # Width of the timestamp-alignment bucket used to synchronise z-scores
     # from different sensors within the same group before computing RMS.
     # Valid range: >= 1 (milliseconds).
 
+    # ------------------------------------------------------------------
+    # Derived fields (computed in __post_init__, never read from env)
+    # ------------------------------------------------------------------
+
+    sensor_value_range_compiled: tuple[tuple[re.Pattern[str], float, float], ...] = field(
+        init=False, repr=False, compare=False
+    )
+    # sensor_value_range with each glob precompiled to a regex, in dict order.
+    # Read via match_sensor_bounds(); do not match with fnmatch per reading.
+
+    alert_min_risk_band_rank: int = field(init=False, repr=False, compare=False)
+    # RISK_BAND_RANK[alert_min_risk_band]; -1 if the band is invalid
+    # (validate_config rejects that case).
+
+    alert_dispatch_min_rank: int = field(init=False, repr=False, compare=False)
+    # RISK_BAND_RANK[alert_dispatch_min_level]; -1 if the level is invalid
+    # (validate_config rejects that case).
+
+    _view: Mapping[str, object] = field(init=False, repr=False, compare=False)
+    # Read-only {field_name: value} snapshot of the env-provided fields.
+    # Built once because the config is frozen; returned by as_dict().
+
+    def __post_init__(self) -> None:
+        """Populate the derived fields from the env-provided ones."""
+        object.__setattr__(
+            self,
+            "sensor_value_range_compiled",
+            _compile_value_ranges(self.sensor_value_range),
+        )
+        object.__setattr__(
+            self,
+            "alert_min_risk_band_rank",
+            RISK_BAND_RANK.get(self.alert_min_risk_band, -1),
+        )
+        object.__setattr__(
+            self,
+            "alert_dispatch_min_rank",
+            RISK_BAND_RANK.get(self.alert_dispatch_min_level, -1),
+        )
+        object.__setattr__(
+            self,
+            "_view",
+            MappingProxyType(
+                {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+            ),
+        )
+
+    def as_dict(self) -> Mapping[str, object]:
+        """Return the cached read-only mapping of every env-provided field.
+
+        Unlike dataclasses.asdict() this does not deep-copy on each call;
+        pass it through dict() if a JSON encoder needs a real dict.
+        """
+        return self._view
+
+    def match_sensor_bounds(self, sensor_id: str) -> tuple[float, float] | None:
+        """Return (min, max) of the first sensor_value_range pattern matching sensor_id.
+
+        Returns None when no pattern matches (the default config ends with "*",
+        so this only happens with a custom SENSOR_VALUE_RANGE).
+        """
+        for regex, lo, hi in self.sensor_value_range_compiled:
+            if regex.match(sensor_id):
+                return lo, hi
+        return None
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_env(cls, env: Mapping[str, str] | None = None) -> "_Config":
+        """Build a config from a single snapshot of the process environment.
+
+        Args:
+            env: Mapping to read overrides from (defaults to os.environ).
+                 Tests can pass a plain dict instead of patching os.environ.
+        """
+        if env is None:
+            env = os.environ
+        get = env.get
+        return cls(
+            window_seconds=int(get("WINDOW_SECONDS", "300")),
+            window_duration_ms=int(get("WINDOW_DURATION_MS", "30000")),
+            window_hop_ms=int(get("WINDOW_HOP_MS", "5000")),
+            zscore_threshold=float(get("ZSCORE_THRESHOLD", "3.0")),
+            epsilon=float(get("EPSILON", "1e-9")),
+            persistence_count=int(get("PERSISTENCE_COUNT", "3")),
+            alert_cooldown_seconds=int(get("ALERT_COOLDOWN_SECONDS", "60")),
+            alert_min_risk_band=get("ALERT_MIN_RISK_BAND", "MEDIUM").upper(),
+            metrics_log_interval_seconds=int(get("METRICS_LOG_INTERVAL_SECONDS", "30")),
+            metrics_emit_interval_seconds=int(get("METRICS_EMIT_INTERVAL_SECONDS", "10")),
+            timeline_ttl_seconds=int(get("TIMELINE_TTL_SECONDS", "600")),
+            metrics_output_path=get("METRICS_OUTPUT_PATH", "data/alerts/pipeline_metrics.json"),
+            log_level=get("LOG_LEVEL", "INFO").upper(),
+            input_time_format=get("INPUT_TIME_FORMAT", "%Y-%m-%d %H:%M"),
+            input_schema_sensor_column=get("INPUT_SCHEMA_SENSOR_COLUMN", "factory_id"),
+            input_schema_value_column=get("INPUT_SCHEMA_VALUE_COLUMN", "cod"),
+            max_sensor_id_length=int(get("MAX_SENSOR_ID_LENGTH", "64")),
+            sensor_value_range=_json_env(env, "SENSOR_VALUE_RANGE", _DEFAULT_SENSOR_VALUE_RANGE),
+            cetp_data_directory=get("CETP_DATA_DIR", "data/cetp"),
+            factory_data_directory=get("FACTORY_DATA_DIR", "data/factories"),
+            alert_log_path=get("ALERT_LOG_PATH", "data/alerts/evidence_log.jsonl"),
+            tamper_log_path=get("TAMPER_LOG_PATH", "data/alerts/tamper_log.jsonl"),
+            cod_baseline=float(get("COD_BASELINE", "193.0")),
+            cod_threshold=float(get("COD_THRESHOLD", "200.0")),
+            pipe_travel_minutes=int(get("PIPE_TRAVEL_MINUTES", "15")),
+            asof_tolerance_seconds=int(get("ASOF_TOLERANCE_SECONDS", "120")),
+            attribution_bucket_seconds=int(get("ATTRIBUTION_BUCKET_SECONDS", "60")),
+            zero_variance_minutes=int(get("ZERO_VARIANCE_MINUTES", "5")),
+            cod_drop_fraction=float(get("COD_DROP_FRACTION", "0.80")),
+            tss_stable_fraction=float(get("TSS_STABLE_FRACTION", "0.20")),
+            blackout_min_minutes=int(get("BLACKOUT_MIN_MINUTES", "10")),
+            shield_webhook_url=get("SHIELD_WEBHOOK_URL", ""),
+            webhook_max_retries=int(get("WEBHOOK_MAX_RETRIES", "5")),
+            webhook_backoff_max_seconds=float(get("WEBHOOK_BACKOFF_MAX_SECONDS", "30")),
+            webhook_cb_threshold=int(get("WEBHOOK_CB_THRESHOLD", "5")),
+            webhook_cb_cooldown_seconds=float(get("WEBHOOK_CB_COOLDOWN_SECONDS", "60")),
+            alert_dispatch_min_level=get("ALERT_DISPATCH_MIN_LEVEL", "HIGH").upper(),
+            webhook_rate_per_second=float(get("WEBHOOK_RATE_PER_SECOND", "5")),
+            webhook_burst=int(get("WEBHOOK_BURST", "20")),
+            email_batch_interval_seconds=float(get("EMAIL_BATCH_INTERVAL_SECONDS", "300")),
+            alert_log_queue_size=int(get("ALERT_LOG_QUEUE_SIZE", "4096")),
+            alert_log_flush_every_n=int(get("ALERT_LOG_FLUSH_EVERY_N", "128")),
+            alert_log_flush_interval_ms=int(get("ALERT_LOG_FLUSH_INTERVAL_MS", "200")),
+            alert_log_format=get("ALERT_LOG_FORMAT", "jsonl").lower(),
+            alert_log_fsync_every=int(get("ALERT_LOG_FSYNC_EVERY", "16")),
+            river_sensitivity=_json_env(env, "RIVER_SENSITIVITY", _DEFAULT_RIVER_SENSITIVITY),
+            default_sensitivity=float(get("DEFAULT_SENSITIVITY", "2.0")),
+            severity_multiplier=float(get("SEVERITY_MULTIPLIER", "1.0")),
+            eri_threshold_low=float(get("ERI_THRESHOLD_LOW", "2.0")),
+            eri_threshold_medium=float(get("ERI_THRESHOLD_MEDIUM", "5.0")),
+            eri_threshold_high=float(get("ERI_THRESHOLD_HIGH", "10.0")),
+            sensor_groups=_json_env(env, "SENSOR_GROUPS", _DEFAULT_SENSOR_GROUPS),
+            group_threshold=float(get("GROUP_THRESHOLD", "2.5")),
+            sync_tolerance_ms=int(get("SYNC_TOLERANCE_MS", "5000")),
+        )
+
 
 # ---------------------------------------------------------------------------
 # Module-level singleton — the one true CONFIG object
 # ---------------------------------------------------------------------------
 
-CONFIG: _Config = _Config()
+CONFIG: _Config = _Config.from_env()
 
 
 # ---------------------------------------------------------------------------
 # Pipeline Start Time
 # ---------------------------------------------------------------------------
 
-# Captured once at module initialization. Used for uptime calculation.
-PIPELINE_START_TIME: float = time.time()
+# Captured on first use, not at import, so processes that only read constants
+# never pin an uptime origin. The pipeline entrypoint calls
+# get_pipeline_start_time() once at startup to freeze the value.
+_PIPELINE_START_TIME: float | None = None
+
+
+def get_pipeline_start_time() -> float:
+    """Return the pipeline start time (epoch seconds), capturing it on first call."""
+    global _PIPELINE_START_TIME
+    if _PIPELINE_START_TIME is None:
+        _PIPELINE_START_TIME = time.time()
+    return _PIPELINE_START_TIME
+
+
+def __getattr__(name: str) -> float:
+    """Keep `config.PIPELINE_START_TIME` working as a lazy alias (PEP 562)."""
+    if name == "PIPELINE_START_TIME":
+        return get_pipeline_start_time()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 
@@ -372,182 +581,209 @@ _VALID_LOG_LEVELS: frozenset[str] = frozenset(
     {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
 )
 
+# Derived from RISK_BAND_RANK so the valid set and the rank table cannot drift.
+_VALID_RISK_BANDS: frozenset[str] = frozenset(RISK_BAND_RANK)
+_VALID_ALERT_LOG_FORMATS: frozenset[str] = frozenset({"jsonl", "msgpack"})
 
-def validate_config(cfg: _Config = CONFIG) -> None:
-    """Raise ValueError if any CONFIG field violates its documented constraint.
 
-    Args:
-        cfg: Config instance to validate (defaults to the module singleton CONFIG).
+def _is_non_blank(value: str) -> bool:
+    """Return True if value has a non-whitespace character (no stripped copy made)."""
+    return bool(value) and not value.isspace()
 
-    Raises:
-        ValueError: Describing the first constraint that is violated.
-    """
+
+# (predicate(key, item) -> ok, message) — one rule for each entry of a dict field.
+# Messages receive k (the entry key) and item (the entry value).
+_ItemRule = tuple[Callable[[Any, Any], bool], str]
+
+# Checked in order; the first failure is reported. Each row is either
+#   (field_name, predicate(value, cfg) -> ok, message)
+#     message is a str.format template receiving v (the field value) and
+#     c (the config), or
+#   (field_name, (item_rule, ...), None)
+#     every entry of the dict field is checked against all item rules
+#     before moving on to the next entry.
+_VALIDATORS: tuple[
+    tuple[str, Callable[[Any, _Config], bool], str] | tuple[str, tuple[_ItemRule, ...], None],
+    ...,
+] = (
     # --- z-score scorer ---
-    if cfg.window_seconds < 10:
-        raise ValueError(
-            f"window_seconds must be >= 10 (got {cfg.window_seconds}). "
-            "Shorter windows produce statistically unreliable z-scores."
-        )
-    if cfg.window_hop_ms < 1:
-        raise ValueError(
-            f"window_hop_ms must be >= 1 ms (got {cfg.window_hop_ms})."
-        )
-    if cfg.window_duration_ms <= cfg.window_hop_ms:
-        raise ValueError(
-            f"window_duration_ms ({cfg.window_duration_ms}) must be strictly "
-            f"greater than window_hop_ms ({cfg.window_hop_ms})."
-        )
-    if cfg.zscore_threshold <= 0.0:
-        raise ValueError(
-            f"zscore_threshold must be > 0.0 (got {cfg.zscore_threshold})."
-        )
-    if not (0.0 < cfg.epsilon < 1e-6):
-        raise ValueError(
-            f"epsilon must be in (0.0, 1e-6) (got {cfg.epsilon}). "
-            "It is a numerical floor for stddev — it must be negligibly small."
-        )
+    ("window_seconds", lambda v, c: v >= 10,
+     "window_seconds must be >= 10 (got {v}). "
+     "Shorter windows produce statistically unreliable z-scores."),
+    ("window_hop_ms", lambda v, c: v >= 1,
+     "window_hop_ms must be >= 1 ms (got {v})."),
+    ("window_duration_ms", lambda v, c: v > c.window_hop_ms,
+     "window_duration_ms ({v}) must be strictly "
+     "greater than window_hop_ms ({c.window_hop_ms})."),
+    ("zscore_threshold", lambda v, c: v > 0.0,
+     "zscore_threshold must be > 0.0 (got {v})."),
+    ("epsilon", lambda v, c: 0.0 < v < 1e-6,
+     "epsilon must be in (0.0, 1e-6) (got {v}). "
+     "It is a numerical floor for stddev — it must be negligibly small."),
 
     # --- persistence filter ---
-    if cfg.persistence_count < 1:
-        raise ValueError(
-            f"persistence_count must be >= 1 (got {cfg.persistence_count})."
-        )
+    ("persistence_count", lambda v, c: v >= 1,
+     "persistence_count must be >= 1 (got {v})."),
 
     # --- alert gating ---
-    if cfg.alert_cooldown_seconds < 0:
-        raise ValueError(
-            f"alert_cooldown_seconds must be >= 0 (got {cfg.alert_cooldown_seconds})."
-        )
-    _VALID_RISK_BANDS: frozenset[str] = frozenset({"LOW", "MEDIUM", "HIGH", "CRITICAL"})
-    if cfg.alert_min_risk_band not in _VALID_RISK_BANDS:
-        raise ValueError(
-            f"alert_min_risk_band must be one of {sorted(_VALID_RISK_BANDS)} "
-            f"(got {cfg.alert_min_risk_band!r})."
-        )
-    if cfg.metrics_log_interval_seconds < 1:
-        raise ValueError(
-            f"metrics_log_interval_seconds must be >= 1 (got {cfg.metrics_log_interval_seconds})."
-        )
-    if cfg.metrics_emit_interval_seconds < 1:
-        raise ValueError(
-            f"metrics_emit_interval_seconds must be >= 1 (got {cfg.metrics_emit_interval_seconds})."
-        )
-
+    ("alert_cooldown_seconds", lambda v, c: v >= 0,
+     "alert_cooldown_seconds must be >= 0 (got {v})."),
+    ("alert_min_risk_band", lambda v, c: v in _VALID_RISK_BANDS,
+     f"alert_min_risk_band must be one of {sorted(_VALID_RISK_BANDS)} "
+     "(got {v!r})."),
+    ("metrics_log_interval_seconds", lambda v, c: v >= 1,
+     "metrics_log_interval_seconds must be >= 1 (got {v})."),
+    ("metrics_emit_interval_seconds", lambda v, c: v >= 1,
+     "metrics_emit_interval_seconds must be >= 1 (got {v})."),
+    ("timeline_ttl_seconds", lambda v, c: v >= 1,
+     "timeline_ttl_seconds must be >= 1 (got {v})."),
 
     # --- logging ---
-    if cfg.log_level not in _VALID_LOG_LEVELS:
-        raise ValueError(
-            f"log_level must be one of {sorted(_VALID_LOG_LEVELS)} "
-            f"(got {cfg.log_level!r})."
-        )
+    ("log_level", lambda v, c: v in _VALID_LOG_LEVELS,
+     f"log_level must be one of {sorted(_VALID_LOG_LEVELS)} "
+     "(got {v!r})."),
 
     # --- input schema ---
-    if not cfg.input_time_format.strip():
-        raise ValueError("input_time_format must not be empty.")
-    if not cfg.input_schema_sensor_column.strip():
-        raise ValueError("input_schema_sensor_column must not be empty.")
-    if not cfg.input_schema_value_column.strip():
-        raise ValueError("input_schema_value_column must not be empty.")
-
-    if cfg.max_sensor_id_length < 1:
-        raise ValueError(
-            f"max_sensor_id_length must be >= 1 (got {cfg.max_sensor_id_length})."
-        )
-
-    if not isinstance(cfg.sensor_value_range, dict):
-        raise ValueError("sensor_value_range must be a dictionary.")
-    for pattern, bounds in cfg.sensor_value_range.items():
-        if not (isinstance(bounds, list) and len(bounds) == 2):
-            raise ValueError(
-                f"sensor_value_range[{pattern!r}] must be a list of [min, max]."
-            )
-        if not (isinstance(bounds[0], (int, float)) and isinstance(bounds[1], (int, float))):
-            raise ValueError(
-                f"sensor_value_range[{pattern!r}] bounds must be numeric."
-            )
-        if bounds[0] >= bounds[1]:
-            raise ValueError(
-                f"sensor_value_range[{pattern!r}] min ({bounds[0]}) must be "
-                f"strictly less than max ({bounds[1]})."
-            )
-
+    ("input_time_format", lambda v, c: _is_non_blank(v),
+     "input_time_format must not be empty."),
+    ("input_schema_sensor_column", lambda v, c: _is_non_blank(v),
+     "input_schema_sensor_column must not be empty."),
+    ("input_schema_value_column", lambda v, c: _is_non_blank(v),
+     "input_schema_value_column must not be empty."),
+    ("max_sensor_id_length", lambda v, c: v >= 1,
+     "max_sensor_id_length must be >= 1 (got {v})."),
+    ("sensor_value_range", lambda v, c: isinstance(v, dict),
+     "sensor_value_range must be a dictionary."),
+    ("sensor_value_range", (
+        (lambda k, b: isinstance(b, list) and len(b) == 2,
+         "sensor_value_range[{k!r}] must be a list of [min, max]."),
+        (lambda k, b: isinstance(b[0], (int, float)) and isinstance(b[1], (int, float)),
+         "sensor_value_range[{k!r}] bounds must be numeric."),
+        (lambda k, b: b[0] < b[1],
+         "sensor_value_range[{k!r}] min ({item[0]}) must be "
+         "strictly less than max ({item[1]})."),
+    ), None),
 
     # --- tripwire thresholds ---
-    if cfg.cod_baseline <= 0.0:
-        raise ValueError(
-            f"cod_baseline must be > 0.0 mg/L (got {cfg.cod_baseline})."
-        )
-    if cfg.cod_threshold <= cfg.cod_baseline:
-        raise ValueError(
-            f"cod_threshold ({cfg.cod_threshold}) must be > cod_baseline "
-            f"({cfg.cod_baseline}). Threshold must exceed the baseline mean."
-        )
+    ("cod_baseline", lambda v, c: v > 0.0,
+     "cod_baseline must be > 0.0 mg/L (got {v})."),
+    ("cod_threshold", lambda v, c: v > c.cod_baseline,
+     "cod_threshold ({v}) must be > cod_baseline "
+     "({c.cod_baseline}). Threshold must exceed the baseline mean."),
 
     # --- backtracking ---
-    if cfg.pipe_travel_minutes < 1:
-        raise ValueError(
-            f"pipe_travel_minutes must be >= 1 (got {cfg.pipe_travel_minutes})."
-        )
-    if cfg.asof_tolerance_seconds < 1:
-        raise ValueError(
-            f"asof_tolerance_seconds must be >= 1 (got {cfg.asof_tolerance_seconds})."
-        )
+    ("pipe_travel_minutes", lambda v, c: v >= 1,
+     "pipe_travel_minutes must be >= 1 (got {v})."),
+    ("asof_tolerance_seconds", lambda v, c: v >= 1,
+     "asof_tolerance_seconds must be >= 1 (got {v})."),
+    ("attribution_bucket_seconds", lambda v, c: v >= 0,
+     "attribution_bucket_seconds must be >= 0 (got {v})."),
+    ("attribution_bucket_seconds", lambda v, c: v <= c.asof_tolerance_seconds,
+     "attribution_bucket_seconds ({v}) must not exceed "
+     "asof_tolerance_seconds ({c.asof_tolerance_seconds})."),
 
     # --- anti-cheat ---
-    if cfg.zero_variance_minutes < 1:
-        raise ValueError(
-            f"zero_variance_minutes must be >= 1 (got {cfg.zero_variance_minutes})."
-        )
-    if not (0.0 < cfg.cod_drop_fraction < 1.0):
-        raise ValueError(
-            f"cod_drop_fraction must be in (0.0, 1.0) (got {cfg.cod_drop_fraction})."
-        )
-    if not (0.0 < cfg.tss_stable_fraction < 1.0):
-        raise ValueError(
-            f"tss_stable_fraction must be in (0.0, 1.0) (got {cfg.tss_stable_fraction})."
-        )
-    if cfg.blackout_min_minutes < 1:
-        raise ValueError(
-            f"blackout_min_minutes must be >= 1 (got {cfg.blackout_min_minutes})."
-        )
+    ("zero_variance_minutes", lambda v, c: v >= 1,
+     "zero_variance_minutes must be >= 1 (got {v})."),
+    ("cod_drop_fraction", lambda v, c: 0.0 < v < 1.0,
+     "cod_drop_fraction must be in (0.0, 1.0) (got {v})."),
+    ("tss_stable_fraction", lambda v, c: 0.0 < v < 1.0,
+     "tss_stable_fraction must be in (0.0, 1.0) (got {v})."),
+    ("blackout_min_minutes", lambda v, c: v >= 1,
+     "blackout_min_minutes must be >= 1 (got {v})."),
 
     # --- multivariate scoring ---
-    if not cfg.sensor_groups:
-        raise ValueError("sensor_groups must not be empty.")
-    for gname, members in cfg.sensor_groups.items():
-        if not members:
-            raise ValueError(
-                f"sensor_groups[{gname!r}] must contain at least one sensor_id."
-            )
-    if cfg.group_threshold <= 0.0:
-        raise ValueError(
-            f"group_threshold must be > 0.0 (got {cfg.group_threshold})."
-        )
-    if cfg.sync_tolerance_ms < 1:
-        raise ValueError(
-            f"sync_tolerance_ms must be >= 1 ms (got {cfg.sync_tolerance_ms})."
-        )
+    ("sensor_groups", lambda v, c: bool(v),
+     "sensor_groups must not be empty."),
+    ("sensor_groups", (
+        (lambda k, members: bool(members),
+         "sensor_groups[{k!r}] must contain at least one sensor_id."),
+    ), None),
+    ("group_threshold", lambda v, c: v > 0.0,
+     "group_threshold must be > 0.0 (got {v})."),
+    ("sync_tolerance_ms", lambda v, c: v >= 1,
+     "sync_tolerance_ms must be >= 1 ms (got {v})."),
+
+    # --- evidence log writer ---
+    ("alert_log_queue_size", lambda v, c: v >= 1,
+     "alert_log_queue_size must be >= 1 (got {v})."),
+    ("alert_log_flush_every_n", lambda v, c: v >= 1,
+     "alert_log_flush_every_n must be >= 1 (got {v})."),
+    ("alert_log_flush_interval_ms", lambda v, c: v >= 1,
+     "alert_log_flush_interval_ms must be >= 1 (got {v})."),
+    ("alert_log_format", lambda v, c: v in _VALID_ALERT_LOG_FORMATS,
+     f"alert_log_format must be one of {sorted(_VALID_ALERT_LOG_FORMATS)} "
+     "(got {v!r})."),
+    ("alert_log_fsync_every", lambda v, c: v >= 1,
+     "alert_log_fsync_every must be >= 1 (got {v})."),
+
+    # --- webhook ---
+    ("webhook_max_retries", lambda v, c: v >= 0,
+     "webhook_max_retries must be >= 0 (got {v})."),
+    ("webhook_backoff_max_seconds", lambda v, c: v > 0,
+     "webhook_backoff_max_seconds must be > 0 (got {v})."),
+    ("webhook_cb_threshold", lambda v, c: v >= 1,
+     "webhook_cb_threshold must be >= 1 (got {v})."),
+    ("webhook_cb_cooldown_seconds", lambda v, c: v > 0,
+     "webhook_cb_cooldown_seconds must be > 0 (got {v})."),
+    ("alert_dispatch_min_level", lambda v, c: v in _VALID_RISK_BANDS,
+     f"alert_dispatch_min_level must be one of {sorted(_VALID_RISK_BANDS)} "
+     "(got {v!r})."),
+    ("webhook_rate_per_second", lambda v, c: v > 0,
+     "webhook_rate_per_second must be > 0 (got {v})."),
+    ("webhook_burst", lambda v, c: v >= 1,
+     "webhook_burst must be >= 1 (got {v})."),
+    ("email_batch_interval_seconds", lambda v, c: v > 0,
+     "email_batch_interval_seconds must be > 0 (got {v})."),
 
     # --- ERI ---
-    for pt, factor in cfg.river_sensitivity.items():
-        if not (1.0 <= factor <= 5.0):
-            raise ValueError(
-                f"river_sensitivity[{pt!r}] must be in [1.0, 5.0] (got {factor})."
-            )
-    if not (1.0 <= cfg.default_sensitivity <= 5.0):
-        raise ValueError(
-            f"default_sensitivity must be in [1.0, 5.0] (got {cfg.default_sensitivity})."
-        )
-    if cfg.severity_multiplier <= 0.0:
-        raise ValueError(
-            f"severity_multiplier must be > 0.0 (got {cfg.severity_multiplier})."
-        )
-    if not (0.0 < cfg.eri_threshold_low < cfg.eri_threshold_medium < cfg.eri_threshold_high):
-        raise ValueError(
-            f"ERI thresholds must satisfy 0 < low ({cfg.eri_threshold_low}) "
-            f"< medium ({cfg.eri_threshold_medium}) "
-            f"< high ({cfg.eri_threshold_high})."
-        )
+    ("river_sensitivity", (
+        (lambda k, factor: 1.0 <= factor <= 5.0,
+         "river_sensitivity[{k!r}] must be in [1.0, 5.0] (got {item})."),
+    ), None),
+    ("default_sensitivity", lambda v, c: 1.0 <= v <= 5.0,
+     "default_sensitivity must be in [1.0, 5.0] (got {v})."),
+    ("severity_multiplier", lambda v, c: v > 0.0,
+     "severity_multiplier must be > 0.0 (got {v})."),
+    ("eri_threshold_low",
+     lambda v, c: 0.0 < v < c.eri_threshold_medium < c.eri_threshold_high,
+     "ERI thresholds must satisfy 0 < low ({v}) "
+     "< medium ({c.eri_threshold_medium}) "
+     "< high ({c.eri_threshold_high})."),
+)
+
+# Last config that passed validation. Held by reference (not id()) so a
+# garbage-collected config can never alias a new, unvalidated one.
+_last_validated: _Config | None = None
+
+
+def validate_config(cfg: _Config = CONFIG) -> None:
+    """Raise ValueError if any CONFIG field violates its documented constraint.
+
+    Runs the _VALIDATORS table in order. Re-validating
+    the most recently validated instance is a no-op.
+
+    Args:
+        cfg: Config instance to validate (defaults to the module singleton CONFIG).
+
+    Raises:
+        ValueError: Describing the first constraint that is violated.
+    """
+    global _last_validated
+    if cfg is _last_validated:
+        return
+
+    for name, check, message in _VALIDATORS:
+        value = getattr(cfg, name)
+        if isinstance(check, tuple):
+            for key, item in value.items():
+                for predicate, item_message in check:
+                    if not predicate(key, item):
+                        raise ValueError(item_message.format(k=key, item=item))
+        elif not check(value, cfg):
+            raise ValueError(message.format(v=value, c=cfg))
+
+    _last_validated = cfg
 
 
 # ---------------------------------------------------------------------------
@@ -556,4 +792,4 @@ def validate_config(cfg: _Config = CONFIG) -> None:
 
 if __name__ == "__main__":
     validate_config(CONFIG)
-    print(json.dumps(asdict(CONFIG), indent=2))
+    print(json.dumps(dict(CONFIG.as_dict()), indent=2))
@@ -0,0 +1,105 @@
+"""
+SHIELD AI — Batch Numeric Kernels
+==================================
+
+Array-at-a-time versions of the per-row scoring math, for callers that hold
+a whole batch of readings (backfills, replay tooling, batch UDFs) rather
+than Pathway's one-row-per-call UDFs.
+
+Numba is optional. When it is installed the kernels are JIT-compiled to
+native loops; otherwise the same functions run as plain NumPy expressions
+with identical results. Semantics match zscore.calculate_zscore /
+zscore._is_anomaly exactly: the denominator is max(std, eps) and a reading
+is anomalous when |z| is strictly greater than the threshold.
+
+Usage
+-----
+    from src._hotmath import anomaly_batch, make_zscore_flag, zscore_batch
+
+    flag = make_zscore_flag(threshold=3.0, eps=1e-9)
+    is_anomaly = flag(values, means, stds)           # np.ndarray[bool]
+
+    z     = zscore_batch(values, means, stds, 1e-9)  # np.ndarray[float64]
+    flags = anomaly_batch(z, 3.0)                    # np.ndarray[bool]
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+HAVE_NUMBA: bool = njit is not None
+
+
+def make_zscore_flag(
+    threshold: float,
+    eps: float,
+) -> Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray]:
+    """Return a kernel flagging |(v − mean) / max(std, eps)| > threshold element-wise.
+
+    threshold and eps are baked into the returned function as constants, so
+    the JIT (when available) specialises the inner loop for them.
+    """
+    if njit is None:
+        def zscore_flag(values: np.ndarray, means: np.ndarray, stds: np.ndarray) -> np.ndarray:
+            """NumPy fallback — same result as the JIT kernel."""
+            return np.abs((values - means) / np.maximum(stds, eps)) > threshold
+        return zscore_flag
+
+    # NOTE: no cache=True — closures over threshold/eps cannot be cached to
+    # disk; each specialisation compiles once per process on first call.
+    # No fastmath either: it would let LLVM assume NaN-free input and break
+    # parity with the NumPy path (NaN readings must never be flagged).
+    @njit
+    def zscore_flag_jit(values, means, stds):
+        out = np.empty(values.size, dtype=np.bool_)
+        for i in range(values.size):
+            sd = eps if eps > stds[i] else stds[i]  # == max(std, eps), NaN-preserving
+            out[i] = abs((values[i] - means[i]) / sd) > threshold
+        return out
+
+    return zscore_flag_jit
+
+
+# ---------------------------------------------------------------------------
+# Unspecialised kernels (threshold / eps passed per call)
+# ---------------------------------------------------------------------------
+
+def _zscore_batch_np(values: np.ndarray, means: np.ndarray, stds: np.ndarray, eps: float) -> np.ndarray:
+    """Return (v − mean) / max(std, eps) element-wise (float64)."""
+    return (values - means) / np.maximum(stds, eps)
+
+
+def _anomaly_batch_np(z: np.ndarray, threshold: float) -> np.ndarray:
+    """Return |z| > threshold element-wise."""
+    return np.abs(z) > threshold
+
+
+if njit is None:
+    zscore_batch = _zscore_batch_np
+    anomaly_batch = _anomaly_batch_np
+else:
+    # cache=True is safe here (unlike make_zscore_flag): these take every
+    # parameter as an argument, so the compiled code is written to
+    # __pycache__ and reused by later processes. Still no fastmath, for the
+    # NaN parity reason above.
+    @njit(cache=True)
+    def zscore_batch(values, means, stds, eps):
+        out = np.empty(values.size, dtype=np.float64)
+        for i in range(values.size):
+            sd = eps if eps > stds[i] else stds[i]  # == max(std, eps), NaN-preserving
+            out[i] = (values[i] - means[i]) / sd
+        return out
+
+    @njit(cache=True)
+    def anomaly_batch(z, threshold):
+        out = np.empty(z.size, dtype=np.bool_)
+        for i in range(z.size):
+            out[i] = abs(z[i]) > threshold
+        return out
@@ -15,11 +15,21 @@ Usage
     industrial_stream = build_industrial_stream()
 """
 
-import pathway as pw
+from __future__ import annotations
+
+import functools
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-from src.ingest import load_factory_streams, load_clean_factory_stream
 from config import CONFIG as _cfg
 
+if TYPE_CHECKING:
+    import pathway as pw
+
+# NOTE: pathway (and src.ingest, which builds on it) is imported inside each
+# function rather than here. Importing this module for get_factory_ids or a
+# type hint then costs nothing until a stream is actually built.
+
 _FACTORY_DATA_DIR: str = _cfg.factory_data_directory
 
 
@@ -42,7 +52,24 @@ def build_industrial_stream(
     Returns:
         Unified Pathway Table with columns:
             s_no, time, factory_id, cod, bod, ph, tss, status
+
+    Memoized: every caller asking for the same (resolved factory_dir,
+    include_blackout) pair shares one Pathway subgraph. Tests that rebuild
+    the Pathway graph should call build_industrial_stream.cache_clear().
     """
+    return _build_industrial_stream_cached(
+        str(Path(factory_dir).resolve()), include_blackout
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _build_industrial_stream_cached(
+    factory_dir: str,
+    include_blackout: bool,
+) -> pw.Table:
+    """Construct the stream for an already-normalised factory_dir (cached)."""
+    from src.ingest import load_clean_factory_stream, load_factory_streams
+
     if include_blackout:
         # NOTE: Full stream including NA rows — used by anti_cheat.py (v2).
         # Do NOT use this for the asof_join in backtrack.py (floats only).
@@ -64,6 +91,9 @@ def build_industrial_stream(
     return industrial_stream
 
 
+build_industrial_stream.cache_clear = _build_industrial_stream_cached.cache_clear
+
+
 def get_factory_ids(industrial_stream: pw.Table) -> pw.Table:
     """Return a deduplicated table of all factory_id values seen in the stream.
 
@@ -75,6 +105,8 @@ def get_factory_ids(industrial_stream: pw.Table) -> pw.Table:
     Returns:
         Pathway Table with a single column: factory_id.
     """
+    import pathway as pw
+
     # NOTE: Pathway's groupby on a streaming table produces a live-updating
     # table — new factory_ids appearing in the stream are automatically added.
     return industrial_stream.groupby(pw.this.factory_id).reduce(
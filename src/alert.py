@@ -4,7 +4,7 @@ SHIELD AI — Phase 1: Evidence Log & Alert Dispatch (The Evidence Log)
 
 Consumes the shock_events table from tripwire.py, runs temporal backtrack
 attribution via backtrack.attribute_event(), then:
-    1. Appends every attribution record to an un-falsifiable JSONL log.
+    1. Appends every attribution record to a hash-chained JSONL log.
     2. Optionally fires a webhook POST (configurable via SHIELD_WEBHOOK_URL env var).
 
 Phase 3 extensions (stub hooks included):
@@ -12,7 +12,16 @@ Phase 3 extensions (stub hooks included):
     4. Dispatches an email alert via smtplib.
 
 The JSONL log is the audit trail. Once written, records are never modified.
-Each line is a complete, self-contained JSON object with all evidence fields.
+Each line is a complete, self-contained JSON object with all evidence fields,
+plus ``prev_hash`` / ``hash`` fields linking it to the previous line (see
+src.evidence_chain). evidence_chain.verify_evidence_log() detects any edited, deleted or
+reordered line.
+
+Evidence lines are written by a background _EvidenceWriter thread that owns
+the log file handle and the hash chain: the Pathway callback only enqueues
+the record, so no encoding, hashing or file syscalls happen on the
+pipeline's critical path. With ALERT_LOG_FORMAT=msgpack the same chained
+records are written as binary frames instead of JSON lines.
 
 Usage
 -----
@@ -21,11 +30,19 @@ Usage
     attach_alert_sink(shock_events, factory_index)  # registers pw.io.subscribe
 """
 
-import json
+import atexit
+import io
+import logging
 import os
+import queue
+import random
+import re
 import smtplib
-from datetime import datetime, timezone
+import threading
+import time
+from collections import OrderedDict
 from email.mime.text import MIMEText
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -33,28 +50,304 @@ import httpx
 import pathway as pw
 
 from src.backtrack import attribute_event, build_factory_index
-from config import CONFIG as _cfg
+from src.evidence_chain import (
+    HAVE_MSGPACK, chain_frame, chain_record, last_hash, truncate_partial_tail,
+)
+from src.logger import attach_console_buffer
+from src.timeparse import format_input_time, parse_input_time
+from config import CONFIG as _cfg, RISK_BAND_RANK
+
+logger: logging.Logger = logging.getLogger(__name__)
 
 _ALERT_LOG_PATH:     str = _cfg.alert_log_path
 _SHIELD_WEBHOOK_URL: str = _cfg.shield_webhook_url
+_ATTRIBUTION_BUCKET_MS: int = _cfg.attribution_bucket_seconds * 1000
+_ATTRIBUTION_CACHE_SIZE: int = 4096  # buckets memoised per evidence callback
+
+# Userspace buffer in front of the log fd: many records coalesce into one
+# write() syscall per flush instead of one per record.
+_WRITE_BUFFER_BYTES: int = 64 * 1024
+
+_LOG_OPEN_FLAGS: int = os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_CLOEXEC
+
+# How long close() waits to hand the stop sentinel to a full queue, and then
+# for the worker thread to drain it, before giving up (seconds each).
+_CLOSE_TIMEOUT_S: float = 5.0
+
+# At most one "rate-limited" warning per this many seconds; a sustained
+# alert storm would otherwise log once per skipped record.
+_RATE_LIMIT_LOG_INTERVAL_S: float = 10.0
+
+# Webhook responses worth retrying: rate limiting and transient server errors.
+_RETRYABLE_STATUS: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+# C0 control characters and DEL — replaced in every evidence string so a
+# crafted value cannot fake line breaks in the console, PDF or downstream
+# log tooling.
+_C0_RE: re.Pattern[str] = re.compile(r"[\x00-\x1f\x7f]")
+
+# Keys dropped from nested dicts: prototype-pollution vectors for JavaScript
+# consumers of the JSONL log / webhook payload.
+_BLOCKED_KEYS: frozenset[str] = frozenset({"__proto__", "constructor", "prototype"})
+
+
+# ---------------------------------------------------------------------------
+# Background evidence writer
+# ---------------------------------------------------------------------------
+
+class _EvidenceWriter:
+    """Hash-chain evidence records and append them to the JSONL log from a daemon thread.
+
+    enqueue() never blocks: when the bounded queue is full the record is
+    dropped and counted in ``dropped``. The writer thread appends lines to a
+    64 KiB io.BufferedWriter and flushes it after ALERT_LOG_FLUSH_EVERY_N
+    records or ALERT_LOG_FLUSH_INTERVAL_MS, whichever comes first; the file
+    is fsynced every ALERT_LOG_FSYNC_EVERY flushes. close() flushes
+    everything queued so far. An OSError while writing stops the writer
+    (``failed``); it is logged, and later records are refused and counted.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Open path for appending and start the writer thread.
+
+        The parent directory must already exist (attach_alert_sink creates it).
+
+        Raises:
+            ImportError: If ALERT_LOG_FORMAT=msgpack but msgpack is not
+                installed — raised here, on the caller's thread, rather than
+                from the first encode inside the writer thread.
+        """
+        fmt = _cfg.alert_log_format
+        if fmt == "msgpack" and not HAVE_MSGPACK:
+            raise ImportError("ALERT_LOG_FORMAT=msgpack requires the msgpack package")
+        # A crash mid-write leaves a partial last record; appending after it
+        # would corrupt that line and silently restart the chain.
+        cut = truncate_partial_tail(path, fmt)
+        if cut:
+            logger.warning("EVIDENCE log %s ended in a partial record — %d bytes truncated", path, cut)
+        # O_APPEND keeps POSIX atomic-append semantics if another process
+        # (e.g. a second pipeline instance) appends to the same log;
+        # O_CLOEXEC keeps the fd out of subprocesses.
+        # NOTE: the log is deliberately not preallocated. posix_fallocate()
+        # grows st_size, so O_APPEND writes would land after a block of NUL
+        # bytes and corrupt the JSONL stream.
+        fd = os.open(path, _LOG_OPEN_FLAGS, 0o644)
+        self._buf = io.BufferedWriter(
+            open(fd, "ab", buffering=0), buffer_size=_WRITE_BUFFER_BYTES
+        )
+        self._queue: queue.Queue[dict | None] = queue.Queue(
+            maxsize=_cfg.alert_log_queue_size
+        )
+        self._encode = chain_frame if fmt == "msgpack" else chain_record
+        self._prev_hash = last_hash(path, fmt)  # resume the chain of an existing log
+        self._flushes = 0
+        self._closed = False
+        self.dropped = 0
+        self.failed = False  # set by the writer thread on an unrecoverable write error
+        self._thread = threading.Thread(
+            target=self._run, name="evidence-writer", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def enqueue(self, record: dict) -> bool:
+        """Queue one record; return False (and count a drop) if it cannot be written.
+
+        A record is refused when the queue is full, after close(), or once
+        a write error has stopped the writer (see ``failed``).
+        """
+        if self._closed or self.failed:
+            self.dropped += 1
+            logger.warning(
+                "EVIDENCE writer %s — record dropped (total: %d)",
+                "failed" if self.failed else "closed", self.dropped,
+            )
+            return False
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            logger.warning("EVIDENCE writer queue full — record dropped (total: %d)", self.dropped)
+            return False
+        return True
+
+    def close(self) -> None:
+        """Flush queued lines, fsync, and stop the writer thread (idempotent)."""
+        if self._closed:
+            return
+        self._closed = True
+        _stop_worker(self._queue, self._thread)
+
+    def _flush(self) -> None:
+        """Flush the userspace buffer; fsync every ALERT_LOG_FSYNC_EVERY flushes."""
+        self._buf.flush()
+        self._flushes += 1
+        if self._flushes % _cfg.alert_log_fsync_every == 0:
+            os.fsync(self._buf.fileno())
+
+    def _run(self) -> None:
+        """Writer thread body: write until the stop sentinel, surviving I/O errors."""
+        try:
+            self._write_loop()
+        except OSError:
+            # Disk full, EIO, ...: the chain tip is no longer known to be on
+            # disk, so stop writing and let enqueue() report every drop.
+            self.failed = True
+            logger.exception("EVIDENCE log write failed — writer stopped, records now dropped")
+            while self._queue.get() is not None:  # drain so close() never waits
+                self.dropped += 1
+        try:
+            if not self.failed:
+                self._buf.flush()
+                os.fsync(self._buf.fileno())
+        except OSError:
+            self.failed = True
+            logger.exception("EVIDENCE log final flush failed")
+        finally:
+            try:
+                self._buf.close()
+            except OSError:
+                pass  # already reported; buffered bytes are lost either way
+
+    def _write_loop(self) -> None:
+        """Buffer lines, flush on record count or on the interval timer; return on the sentinel."""
+        interval = _cfg.alert_log_flush_interval_ms / 1000.0
+        pending = 0
+        deadline: float | None = None  # flush-by time of the oldest unflushed line
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                record = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._flush()
+                pending, deadline = 0, None
+                continue
+            if record is None:
+                return
+            try:
+                line, self._prev_hash = self._encode(self._prev_hash, record)
+            except Exception:
+                # One unserialisable record must not kill the thread (which
+                # would leave every later record to be dropped as "queue full").
+                logger.exception("EVIDENCE record could not be encoded — skipped")
+                continue
+            self._buf.write(line)
+            pending += 1
+            if deadline is None:
+                deadline = time.monotonic() + interval
+            if pending >= _cfg.alert_log_flush_every_n:
+                self._flush()
+                pending, deadline = 0, None
+
+
+def _stop_worker(q: "queue.Queue[dict | None]", thread: threading.Thread) -> None:
+    """Hand the stop sentinel to a worker queue and wait for the thread to finish.
+
+    Never blocks indefinitely: if the queue stays full (e.g. the worker died)
+    the sentinel is abandoned with a warning instead of hanging on_end/atexit.
+    """
+    if not thread.is_alive():
+        return
+    try:
+        q.put(None, timeout=_CLOSE_TIMEOUT_S)
+    except queue.Full:
+        logger.warning("%s did not accept the stop signal — not waiting for it", thread.name)
+        return
+    thread.join(timeout=_CLOSE_TIMEOUT_S)
 
 
 # ---------------------------------------------------------------------------
 # JSONL evidence sink
 # ---------------------------------------------------------------------------
 
+def _sanitize(value: Any) -> Any:
+    """Recursively neutralise control characters and blocked keys in value."""
+    if isinstance(value, str):
+        return _C0_RE.sub("\ufffd", value)
+    if isinstance(value, dict):
+        return {
+            k: _sanitize(v) for k, v in value.items() if k not in _BLOCKED_KEYS
+        }
+    if isinstance(value, list):
+        return [_sanitize(v) for v in value]
+    return value
+
+
+@lru_cache(maxsize=1024)
+def _iso_utc_seconds(epoch_s: int) -> str:
+    """Return "YYYY-MM-DDTHH:MM:SS" for a whole UTC epoch second (memoised)."""
+    tm = time.gmtime(epoch_s)
+    return (
+        f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+        f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}"
+    )
+
+
+def _iso_utc_now() -> str:
+    """Return the current UTC time as ISO-8601 with microseconds and +00:00.
+
+    Same text as datetime.now(tz=timezone.utc).isoformat(), except that the
+    microsecond field is always present. Alerts in a burst share the cached
+    seconds prefix, so only the fractional part is formatted per call.
+    """
+    epoch_s, ns = divmod(time.time_ns(), 1_000_000_000)
+    return f"{_iso_utc_seconds(epoch_s)}.{ns // 1000:06d}+00:00"
+
+
+def _attribution_key(cetp_time: str) -> str:
+    """Round cetp_time down to ATTRIBUTION_BUCKET_SECONDS for attribution memoisation.
+
+    Times that do not parse with input_time_format are used verbatim.
+    """
+    if not _ATTRIBUTION_BUCKET_MS:
+        return cetp_time
+    try:
+        epoch_ms = parse_input_time(cetp_time)
+    except (TypeError, ValueError):
+        return cetp_time
+    return format_input_time(epoch_ms - epoch_ms % _ATTRIBUTION_BUCKET_MS)
+
+
 def _make_evidence_callback(
     factory_index,
+    writer: _EvidenceWriter,
+    webhook: "_WebhookDispatcher | None" = None,
 ) -> Any:
     """Return a pw.io.subscribe callback that runs backtrack attribution on each alert.
 
     Args:
         factory_index: Pre-loaded pandas DataFrame from backtrack.build_factory_index().
+        writer:        Background writer that chains and appends the evidence records.
+        webhook:       Background webhook dispatcher, or None when disabled.
 
     Returns:
-        Callable matching the pw.io.subscribe signature.
+        Callable matching the pw.io.subscribe signature. Its cache_clear()
+        drops memoised attributions (call it if factory_index is reloaded).
     """
 
+    # bucket key → attribution of the first event seen in that bucket.
+    # NOTE: the cached dicts are shared between events — read, never mutate.
+    attributions: OrderedDict[str, dict] = OrderedDict()
+
+    def _attribute_cached(cetp_time: str) -> dict:
+        """Return attribute_event() for cetp_time, memoised per attribution bucket.
+
+        The lookup runs with the first real event time seen in each bucket
+        (never the rounded-down bucket start), so a bucket no wider than
+        asof_tolerance_seconds keeps every event within the as-of window
+        of the reading it is attributed from.
+        """
+        key = _attribution_key(cetp_time)
+        attribution = attributions.get(key)
+        if attribution is not None:
+            attributions.move_to_end(key)
+            return attribution
+        attribution = attribute_event(cetp_time, factory_index)
+        attributions[key] = attribution
+        if len(attributions) > _ATTRIBUTION_CACHE_SIZE:
+            attributions.popitem(last=False)
+        return attribution
+
     def _callback(key: pw.Pointer, row: dict, time: int, is_addition: bool) -> None:
         """Write one evidence record to the JSONL log.
 
@@ -74,11 +367,11 @@ def _make_evidence_callback(
         breach    = row.get("breach_mag")
         level     = row.get("alert_level", "MEDIUM")
 
-        # Run temporal backtrack attribution (pandas lookup)
-        attribution = attribute_event(cetp_time, factory_index)
+        # Temporal backtrack attribution (pandas lookup, memoised per bucket)
+        attribution = _attribute_cached(cetp_time)
 
-        record = {
-            "logged_at":          datetime.now(tz=timezone.utc).isoformat(),
+        record = _sanitize({
+            "logged_at":          _iso_utc_now(),
             "cetp_event_time":    cetp_time,
             "cetp_cod":           cetp_cod,
             "breach_mag":         breach,
@@ -88,22 +381,21 @@ def _make_evidence_callback(
             "factory_cod":        attribution["factory_cod"],
             "factory_bod":        attribution["factory_bod"],
             "factory_tss":        attribution["factory_tss"],
-        }
+        })
 
-        Path(_ALERT_LOG_PATH).parent.mkdir(parents=True, exist_ok=True)
-        with open(_ALERT_LOG_PATH, "a", encoding="utf-8") as f:
-            f.write(json.dumps(record) + "\n")
+        writer.enqueue(record)
 
-        print(
-            f"[ALERT] {record['cetp_event_time']} | "
-            f"Factory: {record['attributed_factory']} | "
-            f"COD: {record['cetp_cod']} mg/L | "
-            f"Level: {record['alert_level']}"
+        logger.info(
+            "ALERT %s | Factory: %s | COD: %s mg/L | Level: %s",
+            record["cetp_event_time"], record["attributed_factory"],
+            record["cetp_cod"], record["alert_level"],
         )
 
-        if _SHIELD_WEBHOOK_URL:
-            _fire_webhook(record)
+        # Only records at or above ALERT_DISPATCH_MIN_LEVEL pay network cost.
+        if webhook is not None and RISK_BAND_RANK.get(level, -1) >= _cfg.alert_dispatch_min_rank:
+            webhook.submit(record)
 
+    _callback.cache_clear = attributions.clear
     return _callback
 
 
@@ -117,7 +409,9 @@ def attach_alert_sink(
 ) -> None:
     """Register the JSONL writer as a Pathway subscribe sink on shock_events.
 
-    Builds the factory index if not supplied, then attaches the callback.
+    Builds the factory index if not supplied, starts the background evidence
+    writer (and webhook dispatcher when SHIELD_WEBHOOK_URL is set), then
+    attaches the callback. Both are drained and closed when the stream ends.
 
     Args:
         shock_events:   Output of tripwire.detect_anomalies().
@@ -126,32 +420,210 @@ def attach_alert_sink(
     if factory_index is None:
         factory_index = build_factory_index()
 
-    pw.io.subscribe(shock_events, _make_evidence_callback(factory_index))
+    # ALERT / WEBHOOK lines replaced print(): keep them visible when the
+    # application has not configured logging (no-op when it has).
+    attach_console_buffer(logger)
+
+    # Created once at startup; nothing on the per-alert path touches the
+    # directory.
+    Path(_ALERT_LOG_PATH).parent.mkdir(parents=True, exist_ok=True)
+    writer = _EvidenceWriter(_ALERT_LOG_PATH)
+    webhook = _WebhookDispatcher(_SHIELD_WEBHOOK_URL) if _SHIELD_WEBHOOK_URL else None
+
+    def _on_end() -> None:
+        writer.close()
+        if webhook is not None:
+            webhook.close()
+
+    pw.io.subscribe(
+        shock_events,
+        _make_evidence_callback(factory_index, writer, webhook),
+        on_end=_on_end,
+    )
 
 
 # ---------------------------------------------------------------------------
 # Webhook dispatch
 # ---------------------------------------------------------------------------
 
-def _fire_webhook(record: dict) -> None:
-    """POST the evidence record to the configured webhook URL (best-effort)."""
-    try:
-        response = httpx.post(_SHIELD_WEBHOOK_URL, json=record, timeout=5.0)
-        response.raise_for_status()
-        print(f"[WEBHOOK] Delivered — HTTP {response.status_code}")
-    except Exception as exc:  # noqa: BLE001
-        print(f"[WEBHOOK] Delivery failed: {exc}")
+class _Breaker:
+    """Consecutive-failure circuit breaker for one webhook URL.
+
+    After WEBHOOK_CB_THRESHOLD consecutive failures the circuit opens for
+    WEBHOOK_CB_COOLDOWN_SECONDS. Once the cooldown passes a single probe is
+    let through; another failure re-opens it, a success closes it.
+    """
+
+    __slots__ = ("url", "fails", "open_until")
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.fails = 0
+        self.open_until = 0.0
+
+    def allow(self) -> bool:
+        """Return True if a POST may be attempted now."""
+        return time.monotonic() >= self.open_until
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful delivery."""
+        if self.fails >= _cfg.webhook_cb_threshold:
+            logger.warning("Webhook circuit closed for %s", self.url)
+        self.fails = 0
+        self.open_until = 0.0
+
+    def record_failure(self) -> None:
+        """Count a failed POST and open the circuit once the threshold is hit."""
+        self.fails += 1
+        if self.fails >= _cfg.webhook_cb_threshold:
+            self.open_until = time.monotonic() + _cfg.webhook_cb_cooldown_seconds
+            logger.warning(
+                "Webhook circuit open for %s after %d consecutive failures — "
+                "skipping delivery for %.0fs",
+                self.url, self.fails, _cfg.webhook_cb_cooldown_seconds,
+            )
+
+
+class _TokenBucket:
+    """Token-bucket rate limiter: `rate` tokens per second, at most `burst` banked."""
+
+    __slots__ = ("rate", "burst", "tokens", "stamp")
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = float(burst)
+        self.tokens = float(burst)
+        self.stamp = time.monotonic()
+
+    def take(self) -> bool:
+        """Consume one token if available; return False when rate-limited."""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.stamp) * self.rate)
+        self.stamp = now
+        if self.tokens < 1.0:
+            return False
+        self.tokens -= 1.0
+        return True
+
+
+class _WebhookDispatcher:
+    """Deliver evidence records to the webhook URL from a daemon thread.
+
+    One httpx.Client is shared for the lifetime of the sink, so consecutive
+    alerts reuse the pooled keep-alive connection instead of paying a new
+    TCP/TLS handshake each. Failed POSTs (transport errors, HTTP 429/5xx)
+    are retried up to WEBHOOK_MAX_RETRIES times with exponential backoff and
+    full jitter; retries sleep on this thread, never in the Pathway callback.
+    Other non-2xx responses are not retried but still count as failures for
+    the URL's circuit breaker. While it is open, records are skipped (they
+    are still in the JSONL log) so a dead or misconfigured endpoint cannot
+    back up the queue.
+    submit() is rate-limited by a WEBHOOK_RATE_PER_SECOND / WEBHOOK_BURST
+    token bucket; records over the limit are counted in ``rate_limited`` and
+    reported by a warning at most every _RATE_LIMIT_LOG_INTERVAL_S seconds.
+    The queue is bounded by ALERT_LOG_QUEUE_SIZE; overflow is dropped.
+    """
+
+    def __init__(self, url: str) -> None:
+        """Create the pooled client and start the dispatcher thread."""
+        self._url = url
+        self._breaker = _Breaker(url)
+        self._bucket = _TokenBucket(_cfg.webhook_rate_per_second, _cfg.webhook_burst)
+        self._client = httpx.Client(
+            limits=httpx.Limits(max_keepalive_connections=8),
+            timeout=5.0,
+        )
+        self._queue: queue.Queue[dict | None] = queue.Queue(
+            maxsize=_cfg.alert_log_queue_size
+        )
+        self._closed = False
+        self.dropped = 0
+        self.rate_limited = 0
+        self._rate_limit_logged_at = float("-inf")
+        self._thread = threading.Thread(
+            target=self._run, name="webhook-dispatcher", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, record: dict) -> None:
+        """Queue one record for delivery without blocking."""
+        if not self._bucket.take():
+            self.rate_limited += 1
+            now = time.monotonic()
+            if now - self._rate_limit_logged_at >= _RATE_LIMIT_LOG_INTERVAL_S:
+                self._rate_limit_logged_at = now
+                logger.warning(
+                    "WEBHOOK rate limit reached — record not sent (total: %d)",
+                    self.rate_limited,
+                )
+            return
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            logger.warning("WEBHOOK dispatch queue full — record dropped (total: %d)", self.dropped)
+
+    def close(self) -> None:
+        """Deliver queued records, then stop the thread and close the client (idempotent)."""
+        if self._closed:
+            return
+        self._closed = True
+        _stop_worker(self._queue, self._thread)
+
+    def _run(self) -> None:
+        """Dispatcher loop: POST each queued record until the stop sentinel."""
+        while (record := self._queue.get()) is not None:
+            self._deliver(record)
+        self._client.close()
+
+    def _deliver(self, record: dict) -> None:
+        """POST one record, retrying transient failures with jittered backoff."""
+        breaker = self._breaker
+        for attempt in range(_cfg.webhook_max_retries + 1):
+            if not breaker.allow():
+                logger.debug("WEBHOOK circuit open — delivery skipped")
+                return
+            if attempt:
+                cap = min(_cfg.webhook_backoff_max_seconds, 2.0 ** (attempt - 1))
+                time.sleep(random.uniform(0.0, cap))
+            try:
+                response = self._client.post(self._url, json=record)
+            except httpx.TransportError as exc:
+                breaker.record_failure()
+                logger.warning("WEBHOOK delivery attempt %d failed: %s", attempt + 1, exc)
+                continue
+            if response.status_code in _RETRYABLE_STATUS:
+                breaker.record_failure()
+                logger.warning(
+                    "WEBHOOK delivery attempt %d failed: HTTP %d", attempt + 1, response.status_code
+                )
+                continue
+            if response.is_success:
+                breaker.record_success()
+                logger.info("WEBHOOK delivered — HTTP %d", response.status_code)
+            else:
+                # Not retried, but still a failure for the breaker: a
+                # misconfigured endpoint (bad URL, auth) must open the circuit.
+                breaker.record_failure()
+                logger.warning("WEBHOOK delivery rejected — HTTP %d", response.status_code)
+            return
+        logger.error("WEBHOOK giving up after %d attempts", _cfg.webhook_max_retries + 1)
 
 
 # ---------------------------------------------------------------------------
 # Email alert (Phase 3 stub)
 # ---------------------------------------------------------------------------
 
-def send_email_alert(record: dict) -> None:
-    """Send an HTML email alert for a single evidence record (Phase 3 stub).
+# Below-threshold records awaiting the next digest email, and the timer that
+# will send it. Guarded by _email_lock (the timer fires on its own thread).
+_email_batch: list[dict] = []
+_email_timer: threading.Timer | None = None
+_email_lock = threading.Lock()
 
-    Configure via env vars: SMTP_HOST, SMTP_PORT, SMTP_USER, SMTP_PASS, ALERT_EMAIL_TO.
-    """
+
+def _send_html_email(subject: str, body: str) -> None:
+    """Send one HTML email via the SMTP_* env settings; no-op if SMTP is unconfigured."""
     smtp_host = os.getenv("SMTP_HOST", "")
     smtp_port = int(os.getenv("SMTP_PORT", "587"))
     smtp_user = os.getenv("SMTP_USER", "")
@@ -161,6 +633,43 @@ def send_email_alert(record: dict) -> None:
     if not all([smtp_host, smtp_user, smtp_pass, to_addr]):
         return  # SMTP not configured
 
+    msg = MIMEText(body, "html")
+    msg["Subject"] = subject
+    msg["From"]    = smtp_user
+    msg["To"]      = to_addr
+
+    try:
+        with smtplib.SMTP(smtp_host, smtp_port) as server:
+            server.starttls()
+            server.login(smtp_user, smtp_pass)
+            server.send_message(msg)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("EMAIL send failed: %s", exc)
+
+
+def send_email_alert(record: dict) -> None:
+    """Send an HTML email alert for a single evidence record (Phase 3 stub).
+
+    Records at or above ALERT_DISPATCH_MIN_LEVEL are sent immediately. Lower
+    levels are queued and sent together as one digest email
+    EMAIL_BATCH_INTERVAL_SECONDS after the first of them arrives (or on
+    flush_email_digest()).
+
+    Configure via env vars: SMTP_HOST, SMTP_PORT, SMTP_USER, SMTP_PASS, ALERT_EMAIL_TO.
+    """
+    global _email_timer
+
+    if RISK_BAND_RANK.get(record.get("alert_level"), -1) < _cfg.alert_dispatch_min_rank:
+        with _email_lock:
+            _email_batch.append(record)
+            if _email_timer is None:
+                _email_timer = threading.Timer(
+                    _cfg.email_batch_interval_seconds, flush_email_digest
+                )
+                _email_timer.daemon = True
+                _email_timer.start()
+        return
+
     body = f"""
     <h2>⚠️ SHIELD AI — Shock Load Alert</h2>
     <table>
@@ -172,25 +681,63 @@ def send_email_alert(record: dict) -> None:
     </table>
     <p>Evidence logged: {_ALERT_LOG_PATH}</p>
     """
+    _send_html_email(
+        f"[SHIELD AI] {record['alert_level']} Alert — {record['attributed_factory']}",
+        body,
+    )
+
+
+def flush_email_digest() -> None:
+    """Send all queued below-threshold records as one digest email now."""
+    global _email_timer
+
+    with _email_lock:
+        records = _email_batch[:]
+        _email_batch.clear()
+        if _email_timer is not None:
+            _email_timer.cancel()
+            _email_timer = None
+    if not records:
+        return
+
+    rows = "\n".join(
+        f"      <tr><td>{r.get('cetp_event_time')}</td><td>{r.get('alert_level')}</td>"
+        f"<td>{r.get('cetp_cod')}</td><td>{r.get('attributed_factory')}</td>"
+        f"<td>{r.get('factory_cod')}</td></tr>"
+        for r in records
+    )
+    body = f"""
+    <h2>SHIELD AI — Alert Digest ({len(records)} events)</h2>
+    <table>
+      <tr><th>CETP Event Time</th><th>Level</th><th>CETP COD (mg/L)</th><th>Attributed Factory</th><th>Factory COD @ T-15min</th></tr>
+{rows}
+    </table>
+    <p>Evidence logged: {_ALERT_LOG_PATH}</p>
+    """
+    _send_html_email(f"[SHIELD AI] Alert digest — {len(records)} events", body)
 
-    msg = MIMEText(body, "html")
-    msg["Subject"] = f"[SHIELD AI] {record['alert_level']} Alert — {record['attributed_factory']}"
-    msg["From"]    = smtp_user
-    msg["To"]      = to_addr
 
-    try:
-        with smtplib.SMTP(smtp_host, smtp_port) as server:
-            server.starttls()
-            server.login(smtp_user, smtp_pass)
-            server.send_message(msg)
-    except Exception as exc:  # noqa: BLE001
-        print(f"[EMAIL] Send failed: {exc}")
+atexit.register(flush_email_digest)
 
 
 # ---------------------------------------------------------------------------
 # PDF report (Phase 3 stub)
 # ---------------------------------------------------------------------------
 
+# Per-record detail lines of the PDF report: (record field, line prefix).
+# Built once at import rather than re-creating the list for every record.
+_PDF_FIELDS: tuple[tuple[str, str], ...] = tuple(
+    (field, f"  {label}: ")
+    for field, label in (
+        ("attributed_factory", "Attributed Factory"),
+        ("cetp_cod",           "CETP COD (mg/L)"),
+        ("breach_mag",         "Breach Magnitude"),
+        ("alert_level",        "Alert Level"),
+        ("factory_cod",        "Factory COD @ T-15min"),
+    )
+)
+
+
 def generate_pdf_report(records: list[dict], out_path: str) -> str:
     """Generate a PDF summary of all evidence records (Phase 3 stub).
 
@@ -208,21 +755,15 @@ def generate_pdf_report(records: list[dict], out_path: str) -> str:
     pdf.set_font("Helvetica", "B", 16)
     pdf.cell(0, 10, "SHIELD AI — Evidence Report", ln=True)
     pdf.set_font("Helvetica", size=10)
-    pdf.cell(0, 6, f"Generated: {datetime.now(tz=timezone.utc).isoformat()}", ln=True)
+    pdf.cell(0, 6, f"Generated: {_iso_utc_now()}", ln=True)
     pdf.ln(4)
 
     for i, rec in enumerate(records, 1):
         pdf.set_font("Helvetica", "B", 11)
         pdf.cell(0, 7, f"Event {i}: {rec.get('cetp_event_time', 'N/A')}", ln=True)
         pdf.set_font("Helvetica", size=10)
-        for field, label in [
-            ("attributed_factory", "Attributed Factory"),
-            ("cetp_cod",           "CETP COD (mg/L)"),
-            ("breach_mag",         "Breach Magnitude"),
-            ("alert_level",        "Alert Level"),
-            ("factory_cod",        "Factory COD @ T-15min"),
-        ]:
-            pdf.cell(0, 6, f"  {label}: {rec.get(field, 'N/A')}", ln=True)
+        for field, prefix in _PDF_FIELDS:
+            pdf.cell(0, 6, f"{prefix}{rec.get(field, 'N/A')}", ln=True)
         pdf.ln(2)
 
     pdf.output(out_path)
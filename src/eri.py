@@ -0,0 +1,60 @@
+"""
+SHIELD AI — Environmental Risk Index (ERI) Risk Bands
+======================================================
+
+Maps ERI values onto the four risk bands defined by CONFIG:
+
+    ERI <  eri_threshold_low                          → LOW
+    eri_threshold_low    <= ERI < eri_threshold_medium → MEDIUM
+    eri_threshold_medium <= ERI < eri_threshold_high   → HIGH
+    ERI >= eri_threshold_high                          → CRITICAL
+
+Banding is a single branchless np.searchsorted over a thresholds array
+frozen at import, so a whole batch of ERI values per emit interval is
+classified in one vectorised pass instead of an if/elif chain per row.
+NaN has no band (searchsorted would sort it above every threshold, i.e.
+CRITICAL), so a NaN ERI raises ValueError instead.
+
+Usage
+-----
+    from src.eri import eri_to_band, eri_to_band_rank
+
+    bands = eri_to_band(np.array([1.0, 6.5, 12.0]))   # ['LOW', 'HIGH', 'CRITICAL']
+    ranks = eri_to_band_rank(np.array([1.0, 6.5]))    # [0, 2]  (config.RISK_BAND_RANK)
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from config import CONFIG as _cfg, RISK_BAND_RANK
+
+# float64, not float32: a narrower dtype would round thresholds such as 0.1
+# and misclassify ERI values that sit exactly on a band boundary.
+_ERI_THRESHOLDS: np.ndarray = np.array(
+    [_cfg.eri_threshold_low, _cfg.eri_threshold_medium, _cfg.eri_threshold_high],
+    dtype=np.float64,
+)
+
+# Band names indexed by rank, so searchsorted's output is also the band rank.
+_BAND_NAMES: np.ndarray = np.array(sorted(RISK_BAND_RANK, key=RISK_BAND_RANK.get))
+
+
+def eri_to_band_rank(eri):
+    """Return the RISK_BAND_RANK code (0-3) for each ERI value (scalar or array).
+
+    Raises:
+        ValueError: if any ERI value is NaN.
+    """
+    if np.isnan(eri).any():
+        raise ValueError("ERI value is NaN — cannot assign a risk band")
+    return np.searchsorted(_ERI_THRESHOLDS, eri, side="right")
+
+
+def eri_to_band(eri):
+    """Return the risk band name for each ERI value (scalar or array).
+
+    Raises:
+        ValueError: if any ERI value is NaN.
+    """
+    return _BAND_NAMES[eri_to_band_rank(eri)]
@@ -0,0 +1,269 @@
+"""
+SHIELD AI — Evidence Log Hash Chain
+====================================
+
+Tamper-evidence for the evidence log written by alert.py.
+
+Every record carries the hash of the record before it (``prev_hash``) and
+its own hash (``hash``):
+
+    canon = JSON of the record incl. prev_hash, sorted keys, compact separators
+    hash  = sha256(prev_hash + canon)
+
+The first record of a log chains from GENESIS_HASH. Editing, deleting or
+reordering any line breaks every hash after it, which verify_evidence_log()
+detects. Verification re-derives ``canon`` from the raw line bytes rather
+than re-encoding the parsed record, so it does not depend on the JSON
+encoder reproducing byte-identical output.
+
+Records are encoded with orjson when installed (sorted keys, compact, UTF-8)
+and with the stdlib json module otherwise, configured to the same shape.
+
+Binary format
+-------------
+With ALERT_LOG_FORMAT=msgpack (requires the optional msgpack package) each
+record is a length-prefixed frame instead of a JSON line:
+
+    <u32 little-endian len> <msgpack map incl. prev_hash, sorted keys> <32-byte sha256>
+
+where the digest is sha256(prev_hash + msgpack bytes), the same chain rule
+as above. read_evidence_log() decodes either format back into dicts;
+tools/evidence_to_jsonl.py converts a msgpack log for JSON-only consumers.
+
+A crash can leave a partial record at the end of the log. last_hash()
+resumes from the last complete record, and truncate_partial_tail() (run by
+the writer before it appends) cuts the fragment off so the next record
+starts on a fresh line.
+
+Usage
+-----
+    from src.evidence_chain import read_evidence_log, verify_evidence_log
+
+    ok = verify_evidence_log("data/alerts/evidence_log.jsonl")
+    for record in read_evidence_log("data/alerts/evidence_log.bin", fmt="msgpack"):
+        ...
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import struct
+from collections.abc import Iterator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+HAVE_MSGPACK: bool = msgpack is not None
+
+GENESIS_HASH: str = "0" * 64
+
+LOG_FORMATS: tuple[str, ...] = ("jsonl", "msgpack")
+
+# The hash field is appended after the canonical body, so every chained line
+# ends with exactly this suffix followed by 64 hex digits and '"}'.
+_HASH_MARKER: bytes = b',"hash":"'
+_HASH_SUFFIX_LEN: int = len(_HASH_MARKER) + 64 + 2
+
+# Only the tail of an existing log is read to resume its chain.
+_TAIL_READ_BYTES: int = 64 * 1024
+
+if orjson is not None:
+    _ORJSON_CANONICAL: int = orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# msgpack frame layout: length header, body, raw (not hex) sha256 digest.
+_FRAME_HEADER: struct.Struct = struct.Struct("<I")
+_DIGEST_LEN: int = 32
+
+
+def _canonical(record: dict) -> bytes:
+    """Serialise record deterministically (sorted keys, no whitespace, UTF-8)."""
+    if orjson is not None:
+        return orjson.dumps(record, option=_ORJSON_CANONICAL)
+    return json.dumps(
+        record, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def chain_record(prev_hash: str, record: dict) -> tuple[bytes, str]:
+    """Link record to prev_hash and return (encoded JSONL line, record hash).
+
+    record itself is not modified (it may be shared with the webhook
+    dispatcher); prev_hash and hash are only added to the returned line.
+    """
+    canon = _canonical({**record, "prev_hash": prev_hash})
+    digest = hashlib.sha256(prev_hash.encode("ascii") + canon).hexdigest()
+    line = canon[:-1] + _HASH_MARKER + digest.encode("ascii") + b'"}\n'
+    return line, digest
+
+
+def _msgpack_default(obj):
+    """Convert numpy scalars (which msgpack cannot pack) to Python numbers."""
+    if hasattr(obj, "item"):
+        return obj.item()
+    raise TypeError(f"cannot serialise {type(obj).__name__} to msgpack")
+
+
+def chain_frame(prev_hash: str, record: dict) -> tuple[bytes, str]:
+    """Link record to prev_hash and return (encoded msgpack frame, record hash).
+
+    Like chain_record(), record itself is not modified.
+
+    Raises:
+        ImportError: If the optional msgpack package is not installed.
+    """
+    if msgpack is None:
+        raise ImportError("ALERT_LOG_FORMAT=msgpack requires the msgpack package")
+    body = dict(sorted({**record, "prev_hash": prev_hash}.items()))
+    blob = msgpack.packb(body, use_bin_type=True, default=_msgpack_default)
+    digest = hashlib.sha256(prev_hash.encode("ascii") + blob).digest()
+    return _FRAME_HEADER.pack(len(blob)) + blob + digest, digest.hex()
+
+
+def _iter_frames(path: str) -> Iterator[tuple[bytes, str]]:
+    """Yield (msgpack body, hex digest) for each complete frame of the log at path.
+
+    A truncated trailing frame (e.g. from a crash mid-write) ends iteration.
+    """
+    with open(path, "rb") as fh:
+        while len(header := fh.read(_FRAME_HEADER.size)) == _FRAME_HEADER.size:
+            (length,) = _FRAME_HEADER.unpack(header)
+            blob = fh.read(length)
+            digest = fh.read(_DIGEST_LEN)
+            if len(blob) != length or len(digest) != _DIGEST_LEN:
+                return
+            yield blob, digest.hex()
+
+
+def _complete_length(path: str, fmt: str) -> int:
+    """Return the byte length of the log at path up to its last complete record."""
+    if fmt == "msgpack":
+        return sum(_FRAME_HEADER.size + len(blob) + _DIGEST_LEN for blob, _ in _iter_frames(path))
+    with open(path, "rb") as fh:
+        end = fh.seek(0, os.SEEK_END)
+        while end > 0:
+            start = max(0, end - _TAIL_READ_BYTES)
+            fh.seek(start)
+            newline = fh.read(end - start).rfind(b"\n")
+            if newline >= 0:
+                return start + newline + 1
+            end = start
+    return 0
+
+
+def truncate_partial_tail(path: str, fmt: str = "jsonl") -> int:
+    """Cut an incomplete trailing record (e.g. a crash mid-write) off the log at path.
+
+    Must run before appending to an existing log: otherwise the next record
+    would be glued onto the partial line and the chain would silently
+    restart. Returns the number of bytes removed (0 if the tail was intact
+    or the file is missing).
+    """
+    try:
+        size = os.path.getsize(path)
+    except FileNotFoundError:
+        return 0
+    keep = _complete_length(path, fmt)
+    if keep < size:
+        os.truncate(path, keep)
+    return size - keep
+
+
+def last_hash(path: str, fmt: str = "jsonl") -> str:
+    """Return the hash of the last complete record in the log at path.
+
+    A partial trailing line (no newline yet) is ignored. Returns
+    GENESIS_HASH when the file is missing, empty, or its last complete line
+    is not a chained record (e.g. a log written before chaining existed).
+    msgpack logs have no line delimiter to seek back to, so they are
+    scanned frame by frame from the start.
+    """
+    if fmt == "msgpack":
+        prev = GENESIS_HASH
+        try:
+            for _, prev in _iter_frames(path):
+                pass
+        except FileNotFoundError:
+            pass
+        return prev
+    try:
+        with open(path, "rb") as fh:
+            fh.seek(0, os.SEEK_END)
+            size = fh.tell()
+            fh.seek(max(0, size - _TAIL_READ_BYTES))
+            tail = fh.read()
+    except FileNotFoundError:
+        return GENESIS_HASH
+    complete = tail[:tail.rfind(b"\n") + 1].rstrip(b"\n")  # drop any partial line
+    last = complete.rsplit(b"\n", 1)[-1]
+    if len(last) < _HASH_SUFFIX_LEN or not last.endswith(b'"}'):
+        return GENESIS_HASH
+    if last[-_HASH_SUFFIX_LEN:-66] != _HASH_MARKER:
+        return GENESIS_HASH
+    return last[-66:-2].decode("ascii")
+
+
+def verify_evidence_log(path: str, fmt: str = "jsonl") -> bool:
+    """Return True if every record of the log at path is intact and correctly chained."""
+    if fmt == "msgpack":
+        return _verify_frames(path)
+    prev = GENESIS_HASH
+    with open(path, "rb") as fh:
+        for raw in fh:
+            line = raw.rstrip(b"\n")
+            if not line:
+                continue
+            if len(line) < _HASH_SUFFIX_LEN or line[-_HASH_SUFFIX_LEN:-66] != _HASH_MARKER:
+                return False
+            stored = line[-66:-2].decode("ascii", errors="replace")
+            canon = line[:-_HASH_SUFFIX_LEN] + b"}"
+            try:
+                record = json.loads(canon)
+            except ValueError:
+                return False
+            if record.get("prev_hash") != prev:
+                return False
+            if hashlib.sha256(prev.encode("ascii") + canon).hexdigest() != stored:
+                return False
+            prev = stored
+    return True
+
+
+def _verify_frames(path: str) -> bool:
+    """verify_evidence_log() for msgpack logs; a truncated tail fails verification."""
+    prev = GENESIS_HASH
+    verified_bytes = 0
+    for blob, stored in _iter_frames(path):
+        try:
+            record = msgpack.unpackb(blob, raw=False)
+        except ValueError:  # msgpack's decode errors subclass ValueError
+            return False
+        if not isinstance(record, dict) or record.get("prev_hash") != prev:
+            return False
+        if hashlib.sha256(prev.encode("ascii") + blob).hexdigest() != stored:
+            return False
+        prev = stored
+        verified_bytes += _FRAME_HEADER.size + len(blob) + _DIGEST_LEN
+    return verified_bytes == os.path.getsize(path)
+
+
+def read_evidence_log(path: str, fmt: str = "jsonl") -> Iterator[dict]:
+    """Yield each record of the log at path as a dict, including prev_hash and hash."""
+    if fmt == "msgpack":
+        for blob, digest in _iter_frames(path):
+            record = msgpack.unpackb(blob, raw=False)
+            record["hash"] = digest
+            yield record
+        return
+    with open(path, "rb") as fh:
+        for raw in fh:
+            if raw.strip():
+                yield json.loads(raw)
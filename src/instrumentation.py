@@ -46,7 +46,9 @@ from __future__ import annotations
 
 import logging
 import time
+from collections import OrderedDict
 
+import numpy as np
 import pathway as pw
 
 from config import CONFIG as _cfg
@@ -56,6 +58,7 @@ logger: logging.Logger = logging.getLogger(__name__)
 
 CONFIG: dict = {
     "METRICS_LOG_INTERVAL_SECONDS": _cfg.metrics_log_interval_seconds,
+    "TIMELINE_TTL_SECONDS":         _cfg.timeline_ttl_seconds,
 }
 
 # Shared collector and reporter — module singletons, reset between test runs.
@@ -78,45 +81,136 @@ STAGE_ERI       = "eri"
 STAGE_ALERT     = "alert"
 
 
+# Column of each stage in _TimelineStore's timestamp array.
+_STAGE_COL: dict[str, int] = {
+    STAGE_INGESTION: 0,
+    STAGE_SCORING:   1,
+    STAGE_ERI:       2,
+    STAGE_ALERT:     3,
+}
+
+# Stage timestamps come straight from the vDSO wall clock, bound once here.
+# NOTE: a per-thread "cached now" refreshed from time.monotonic_ns() would
+# still cost one vDSO call per row plus thread-local attribute traffic, so
+# it cannot beat a direct time.time(); it would only coarsen resolution.
+_wall_clock = time.time
+
+# Initial number of event rows; the array doubles when full.
+_TIMELINE_INITIAL_CAPACITY: int = 4096
+
+
 class _TimelineStore:
     """Record wall-clock timestamps for each pipeline stage per event_id.
 
     Key: event_id string "{sensor_id}|{event_time}".
-    Value: dict mapping stage name → time.time() float.
-
-    The store grows monotonically during a pipeline run.  For production use,
-    consider periodically evicting old entries (e.g., after alert emission).
+    Storage: one float64 array of shape (capacity, 4) — a row per event, a
+    column per stage (_STAGE_COL) — plus an event_id → row index.
+    0.0 marks a stage not yet recorded. This avoids allocating an inner dict
+    per event.
+
+    Memory is bounded to in-flight events: pop() frees an event's row once
+    its end-to-end latency has been measured, and record() opportunistically
+    (at most once per second) evicts events first seen more than
+    TIMELINE_TTL_SECONDS ago that never completed. Freed rows are reused.
     """
 
-    def __init__(self) -> None:
-        """Initialise with empty timeline."""
-        self._store: dict[str, dict[str, float]] = {}
+    def __init__(
+        self,
+        capacity: int = _TIMELINE_INITIAL_CAPACITY,
+        ttl_seconds: float = CONFIG["TIMELINE_TTL_SECONDS"],
+    ) -> None:
+        """Initialise with an empty timeline of the given row capacity."""
+        self._ts: np.ndarray = np.zeros((capacity, len(_STAGE_COL)), dtype=np.float64)
+        # event_id → (row, first-seen time), in first-seen order for the TTL sweep.
+        self._idx: OrderedDict[str, tuple[int, float]] = OrderedDict()
+        self._free: list[int] = []
+        self._next_row = 0
+        self._ttl = ttl_seconds
+        self._next_sweep = 0.0
+
+    def _alloc(self, event_id: str, now: float) -> int:
+        """Assign a free row to event_id, doubling the array if none is left."""
+        if self._free:
+            row = self._free.pop()
+        else:
+            row = self._next_row
+            if row == self._ts.shape[0]:
+                grown = np.zeros((2 * row, self._ts.shape[1]), dtype=np.float64)
+                grown[:row] = self._ts
+                self._ts = grown
+            self._next_row += 1
+        self._idx[event_id] = (row, now)
+        return row
+
+    def _release(self, row: int) -> None:
+        """Zero row and return it to the free list."""
+        self._ts[row] = 0.0
+        self._free.append(row)
+
+    def _sweep(self, now: float) -> None:
+        """Evict events first seen more than ttl seconds before now."""
+        cutoff = now - self._ttl
+        while self._idx:
+            event_id, (row, born) = next(iter(self._idx.items()))
+            if born >= cutoff:
+                break
+            del self._idx[event_id]
+            self._release(row)
 
     def record(self, event_id: str, stage: str) -> None:
         """Record the current wall-clock time for event_id at stage."""
-        if event_id not in self._store:
-            self._store[event_id] = {}
-        self._store[event_id][stage] = time.time()
+        now = _wall_clock()
+        if now >= self._next_sweep:
+            self._sweep(now)
+            self._next_sweep = now + 1.0
+        entry = self._idx.get(event_id)
+        row = self._alloc(event_id, now) if entry is None else entry[0]
+        self._ts[row, _STAGE_COL[stage]] = now
+
+    def pop(self, event_id: str) -> tuple[float, ...] | None:
+        """Remove event_id and return its per-stage timestamps, or None if unknown.
+
+        The tuple is ordered by _STAGE_COL (ingestion, scoring, eri, alert).
+        """
+        entry = self._idx.pop(event_id, None)
+        if entry is None:
+            return None
+        row = entry[0]
+        stamps = tuple(self._ts[row].tolist())
+        self._release(row)
+        return stamps
 
     def get_stage_time(self, event_id: str, stage: str) -> float:
         """Return the recorded wall-clock time for (event_id, stage), or 0.0."""
-        return self._store.get(event_id, {}).get(stage, 0.0)
+        entry = self._idx.get(event_id)
+        if entry is None:
+            return 0.0
+        return float(self._ts[entry[0], _STAGE_COL[stage]])
 
     def latency_ms(self, event_id: str, from_stage: str, to_stage: str) -> float:
         """Return (to_stage_time − from_stage_time) × 1000, or -1.0 if unknown."""
-        t0 = self.get_stage_time(event_id, from_stage)
-        t1 = self.get_stage_time(event_id, to_stage)
+        entry = self._idx.get(event_id)
+        if entry is None:
+            return -1.0
+        t0 = self._ts[entry[0], _STAGE_COL[from_stage]]
+        t1 = self._ts[entry[0], _STAGE_COL[to_stage]]
         if t0 == 0.0 or t1 == 0.0:
             return -1.0
-        return (t1 - t0) * 1000.0
+        return float((t1 - t0) * 1000.0)
 
     def reset(self) -> None:
         """Clear all recorded timelines (for testing)."""
-        self._store.clear()
+        self._ts[:] = 0.0
+        self._idx.clear()
+        self._free.clear()
+        self._next_row = 0
+        self._next_sweep = 0.0
 
 
 _timeline: _TimelineStore = _TimelineStore()
 
+_NO_STAMPS: tuple[float, ...] = (0.0,) * len(_STAGE_COL)
+
 
 # ---------------------------------------------------------------------------
 # Pure helpers (stat-less, testable without Pathway)
@@ -127,6 +221,15 @@ def make_event_id(sensor_id: str, event_time: str) -> str:
     return f"{sensor_id}|{event_time}"
 
 
+def latency_from_stamps(stamps: tuple[float, ...], from_stage: str, to_stage: str) -> float:
+    """Return from_stage→to_stage latency in ms from a timestamp tuple; -1.0 if either is missing."""
+    t0 = stamps[_STAGE_COL[from_stage]]
+    t1 = stamps[_STAGE_COL[to_stage]]
+    if t0 == 0.0 or t1 == 0.0:
+        return -1.0
+    return (t1 - t0) * 1000.0
+
+
 # ---------------------------------------------------------------------------
 # Pathway UDFs — one per pipeline stage
 # ---------------------------------------------------------------------------
@@ -173,19 +276,30 @@ def _udf_ingestion_timestamp(event_id: str) -> float:
 
 
 @pw.udf
-def _udf_latency_ms(event_id: str) -> float:
-    """Return end-to-end latency in ms (ingestion → alert); -1.0 if incomplete."""
-    latency = _timeline.latency_ms(event_id, STAGE_INGESTION, STAGE_ALERT)
+def _udf_complete_timeline(event_id: str) -> tuple[float, float, float, float]:
+    """Evict event_id from the timeline and return its stage timestamps.
+
+    The tuple is ordered by _STAGE_COL; 0.0 marks a stage never recorded.
+    Also feeds the end-to-end latency to the collector and reporter.
+    """
+    stamps = _timeline.pop(event_id) or _NO_STAMPS
+    latency = latency_from_stamps(stamps, STAGE_INGESTION, STAGE_ALERT)
     if latency >= 0.0:
         collector.record(latency)
         reporter.maybe_report()
-    return latency
+    return stamps
+
+
+@pw.udf
+def _udf_latency_ms(stamps: tuple[float, float, float, float]) -> float:
+    """Return end-to-end latency in ms (ingestion → alert); -1.0 if incomplete."""
+    return latency_from_stamps(stamps, STAGE_INGESTION, STAGE_ALERT)
 
 
 @pw.udf
-def _udf_stage_latency_ms(event_id: str, stage: str) -> float:
-    """Return ingestion→stage latency in ms; -1.0 if stage timestamp missing."""
-    return _timeline.latency_ms(event_id, STAGE_INGESTION, stage)
+def _udf_stage_latencies(stamps: tuple[float, float, float, float]) -> tuple[float, float, float, float]:
+    """Return ingestion→stage latency in ms for every stage (ordered by _STAGE_COL)."""
+    return tuple(latency_from_stamps(stamps, STAGE_INGESTION, s) for s in _STAGE_COL)
 
 
 # ---------------------------------------------------------------------------
@@ -202,11 +316,13 @@ def instrument_ingestion(sensor_stream: pw.Table) -> pw.Table:
     Streaming semantics: timestamp is recorded when Pathway processes the row —
     i.e., at the moment the row enters the computation graph, not at CSV read.
     """
-    return sensor_stream.with_columns(
+    # Two chained steps so ingestion is recorded exactly once per row; the
+    # timestamp is then read back for the same event_id.
+    with_eid = sensor_stream.with_columns(
         event_id=_udf_record_ingestion(pw.this.sensor_id, pw.this.time),
-        ingestion_timestamp=_udf_ingestion_timestamp(
-            _udf_record_ingestion(pw.this.sensor_id, pw.this.time)
-        ),
+    )
+    return with_eid.with_columns(
+        ingestion_timestamp=_udf_ingestion_timestamp(pw.this.event_id),
     )
 
 
@@ -245,8 +361,9 @@ def build_metrics_stream(instrumented_alert_stream: pw.Table) -> pw.Table:
     Each row contains: event_id, latency_ms (ingestion→stage), pipeline_stage,
     stage_timestamp (wall-clock seconds), and end-to-end latency_ms.
 
-    This function also drives LatencyCollector.record() and MetricsReporter
-    via the _udf_latency_ms side effect.
+    This function also drives LatencyCollector.record() and MetricsReporter,
+    and evicts each alerted event from the timeline store, via the
+    _udf_complete_timeline side effect.
 
     Args:
         instrumented_alert_stream: Output of instrument_alert(), carrying
@@ -256,31 +373,25 @@ def build_metrics_stream(instrumented_alert_stream: pw.Table) -> pw.Table:
         metrics_stream — Pathway Table with columns:
             event_id, latency_ms, pipeline_stage, stage_timestamp.
     """
-    # End-to-end latency (also drives collector + reporter as a side effect)
-    with_e2e = instrumented_alert_stream.with_columns(
-        latency_ms=_udf_latency_ms(pw.this.event_id),
+    # Snapshot and evict the event's timeline (also drives collector +
+    # reporter as a side effect); every per-stage row reads from the snapshot.
+    with_stamps = instrumented_alert_stream.with_columns(
+        stage_stamps=_udf_complete_timeline(pw.this.event_id),
+    )
+    with_e2e = with_stamps.with_columns(
+        latency_ms=_udf_latency_ms(pw.this.stage_stamps),
+        stage_latencies=_udf_stage_latencies(pw.this.stage_stamps),
     )
 
-    # Emit one row per stage for the metrics breakdown
+    # Emit one row per stage for the metrics breakdown, indexing the
+    # per-event tuples computed once above.
     stage_rows = []
-    for stage in (STAGE_INGESTION, STAGE_SCORING, STAGE_ERI, STAGE_ALERT):
-        @pw.udf
-        def _stage_lat(eid: str, _s: str = stage) -> float:
-            return _udf_stage_latency_ms(eid, _s)
-
-        @pw.udf
-        def _stage_ts(eid: str, _s: str = stage) -> float:
-            return _timeline.get_stage_time(eid, _s)
-
-        @pw.udf
-        def _stage_name(_: str, _s: str = stage) -> str:
-            return _s
-
+    for stage, col in _STAGE_COL.items():
         stage_row = with_e2e.select(
             event_id       = pw.this.event_id,
-            latency_ms     = _stage_lat(pw.this.event_id),
-            pipeline_stage = _stage_name(pw.this.event_id),
-            stage_timestamp= _stage_ts(pw.this.event_id),
+            latency_ms     = pw.this.stage_latencies[col],
+            pipeline_stage = stage,
+            stage_timestamp= pw.this.stage_stamps[col],
         )
         stage_rows.append(stage_row)
 
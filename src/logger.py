@@ -0,0 +1,80 @@
+"""
+SHIELD AI — Buffered Console Logging
+=====================================
+
+Console output for the alert path (ALERT / WEBHOOK / EVIDENCE lines) goes
+through the standard logging module instead of print(). When the process
+has not configured logging at all, attach_console_buffer() gives a logger a
+visible default: an INFO-level logging.handlers.MemoryHandler in front of a
+stdout StreamHandler, so a burst of alerts is written in batches rather
+than one stdout write per line.
+
+The buffer is flushed when it holds CONSOLE_LOG_CAPACITY records, when a
+record of level ERROR or above arrives, every CONSOLE_LOG_FLUSH_SECONDS by
+a daemon flusher thread (so the tail of a burst never waits for the next
+record), and at interpreter exit (logging.shutdown closes — and so
+flushes — every handler).
+
+If any handler is already configured for the logger or its ancestors
+(typically root, via logging.basicConfig / dictConfig), nothing is attached
+and records keep flowing to those handlers. Propagation is never changed.
+
+Usage
+-----
+    from src.logger import attach_console_buffer
+
+    attach_console_buffer(logging.getLogger("src.alert"))
+"""
+
+from __future__ import annotations
+
+import logging
+import logging.handlers
+import sys
+import threading
+
+CONSOLE_LOG_CAPACITY:      int   = 64
+CONSOLE_LOG_FLUSH_SECONDS: float = 1.0
+
+
+class _TimedMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that a daemon thread also flushes every flush_seconds."""
+
+    def __init__(self, capacity: int, flush_seconds: float, target: logging.Handler) -> None:
+        """Create the buffer and start its periodic flusher thread."""
+        super().__init__(capacity, flushLevel=logging.ERROR, target=target)
+        self.flush_seconds = flush_seconds
+        self._stopped = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, name="console-log-flusher", daemon=True
+        )
+        self._flusher.start()
+
+    def _flush_periodically(self) -> None:
+        """Flush the buffer every flush_seconds until the handler is closed."""
+        while not self._stopped.wait(self.flush_seconds):
+            self.flush()
+
+    def close(self) -> None:
+        """Stop the flusher thread, then flush and close as MemoryHandler does."""
+        self._stopped.set()
+        super().close()
+
+
+def attach_console_buffer(logger: logging.Logger) -> logging.Logger:
+    """Attach the buffered stdout handler to logger if logging is unconfigured; return logger.
+
+    No-op when logger or any ancestor already has a handler (including one
+    attached by an earlier call). The logger is set to INFO only if no
+    level was configured.
+    """
+    if logger.hasHandlers():
+        return logger
+    target = logging.StreamHandler(sys.stdout)
+    target.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(
+        _TimedMemoryHandler(CONSOLE_LOG_CAPACITY, CONSOLE_LOG_FLUSH_SECONDS, target)
+    )
+    if logger.level == logging.NOTSET:
+        logger.setLevel(logging.INFO)
+    return logger
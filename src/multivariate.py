@@ -8,7 +8,8 @@ groups to produce a group-level composite anomaly score with causal attribution.
 Algorithm
 ---------
 For each sensor group defined in CONFIG.sensor_groups:
-  1. Filter scored_stream to sensors belonging to the group.
+  1. Tag each scored_stream row with the groups its sensor belongs to
+     (one membership lookup per row, then flatten — no per-sensor filters).
   2. Align readings into SYNC_TOLERANCE_MS time buckets (floor division).
   3. Within each bucket, collect the z-score from every sensor that fired.
   4. Compute composite_score = sqrt(sum(z_i^2) / n)   — RMS of z-scores.
@@ -16,15 +17,19 @@ For each sensor group defined in CONFIG.sensor_groups:
   6. Emit a row to group_anomalies for every time bucket.
 
 Sensor membership is encoded as an integer bitmask (bit i = member i fired)
-so that a single pw.reducers.sum() reducer tracks which sensors contributed.
+so that a single bitwise-OR reducer (_bit_or) tracks which sensors contributed.
 Individual z-scores for attribution are tracked in _ZScoreTracker, a
 module-level stateful store (same design as persistence._SensorStateStore).
+Readings with z² under _TRACK_Z_SQ_FLOOR are not tracked; they still count
+towards composite_score (and set their bit in sensor_bitmask), and appear
+in attribution_detail with a 0.0 fraction.
 
 Inputs
 ------
     scored_stream: Pathway Table from zscore.build_scored_stream() or
                    detection.build_scored_stream(), with columns:
-                       sensor_id (str), timestamp (str), z_score (float)
+                       sensor_id (str), timestamp (str), z_score (float),
+                       and optionally z_score_sq (float)
 
 Outputs
 -------
@@ -38,34 +43,46 @@ Outputs
         top_contributor      (str)   — sensor_id with largest z^2 fraction
         attribution_detail   (str)   — JSON {sensor_id: fraction_3dp} descending
         alert_message        (str)   — human-readable anomaly summary
+    The three attribution columns are "" unless is_group_anomaly.
 
 Assumptions
 -----------
 - sensor_id values in scored_stream match the strings in CONFIG.sensor_groups.
-- timestamp strings conform to CONFIG.input_time_format.
+- timestamp strings conform to CONFIG.input_time_format and are UTC
+  (bucket edges fall on UTC multiples of SYNC_TOLERANCE_MS, whatever the
+  host time zone).
 - No I/O, no sinks, no pw.run() — pure Pathway graph construction.
 - All tuning parameters come from config.CONFIG.
 """
 
 from __future__ import annotations
 
+import functools
 import logging
 import math
+from collections import defaultdict
 
 import pathway as pw
 
+from config import CONFIG as _cfg
 import src.attribution as _attribution
-import src.config as _config_mod
+from src.timeparse import format_input_time, parse_input_time
 
 logger: logging.Logger = logging.getLogger(__name__)
 
 CONFIG: dict = {
-    "SENSOR_GROUPS":     _config_mod.CONFIG.sensor_groups,    # group → [sensor_ids]
-    "GROUP_THRESHOLD":   _config_mod.CONFIG.group_threshold,  # RMS threshold for alarm
-    "SYNC_TOLERANCE_MS": _config_mod.CONFIG.sync_tolerance_ms, # bucket width (ms)
+    "SENSOR_GROUPS":     _cfg.sensor_groups,     # group → [sensor_ids]
+    "GROUP_THRESHOLD":   _cfg.group_threshold,   # RMS threshold for alarm
+    "SYNC_TOLERANCE_MS": _cfg.sync_tolerance_ms, # bucket width (ms)
 }
 
 
+# Hot-path copies of CONFIG values, bound once at import (same pattern as
+# zscore): per-row code reads a module global, and native column
+# expressions get them baked into the graph as constants.
+_GROUP_THRESHOLD:   float = CONFIG["GROUP_THRESHOLD"]
+_SYNC_TOLERANCE_MS: int   = CONFIG["SYNC_TOLERANCE_MS"]
+
 # ---------------------------------------------------------------------------
 # Stateful store for per-sensor z-scores (attribution data)
 # ---------------------------------------------------------------------------
@@ -75,76 +92,189 @@ class _ZScoreTracker:
 
     def __init__(self) -> None:
         """Initialise with empty store."""
-        self._store: dict[tuple[str, str], dict[str, float]] = {}
+        # defaultdict: record() is one probe + one store, no membership branch.
+        self._store: defaultdict[tuple[str, str], dict[str, float]] = defaultdict(dict)
+        # (group, bucket) → (sensor_bitmask, attribution bundle); dropped
+        # whenever the bucket's z-scores change and ignored when its bitmask
+        # differs, so Pathway re-evaluating an unchanged bucket skips the
+        # fraction/sort/format work.
+        self._attrib_cache: dict[tuple[str, str], tuple[int, tuple[str, str, str]]] = {}
 
     def record(self, group_name: str, bucket: str, sensor_id: str, z_score: float) -> None:
         """Record or update z_score for sensor_id in the given (group, bucket)."""
         key = (group_name, bucket)
-        if key not in self._store:
-            self._store[key] = {}
         self._store[key][sensor_id] = z_score
+        self._attrib_cache.pop(key, None)
+
+    def discard(self, group_name: str, bucket: str, sensor_id: str) -> None:
+        """Drop sensor_id's z_score from the given (group, bucket), if recorded."""
+        key = (group_name, bucket)
+        scores = self._store.get(key)
+        if scores is not None and scores.pop(sensor_id, None) is not None:
+            self._attrib_cache.pop(key, None)
+
+    def cached_attribution(
+        self, group_name: str, bucket: str, bitmask: int
+    ) -> tuple[str, str, str] | None:
+        """Return the bundle cached for (group, bucket) under bitmask, or None."""
+        cached = self._attrib_cache.get((group_name, bucket))
+        if cached is None or cached[0] != bitmask:
+            return None
+        return cached[1]
+
+    def cache_attribution(
+        self, group_name: str, bucket: str, bitmask: int, bundle: tuple[str, str, str]
+    ) -> None:
+        """Cache bundle for (group, bucket, bitmask) until its z-scores next change."""
+        self._attrib_cache[(group_name, bucket)] = (bitmask, bundle)
 
     def get(self, group_name: str, bucket: str) -> dict[str, float]:
-        """Return {sensor_id: z_score} for the given (group, bucket), or {}."""
+        """Return {sensor_id: z_score} for the given (group, bucket), or {}.
+
+        Uses dict.get, so reading an unknown bucket does not create an entry.
+        """
         return self._store.get((group_name, bucket), {})
 
     def reset_all(self) -> None:
-        """Clear all recorded z-scores (for testing)."""
+        """Clear all recorded z-scores and cached attributions (for testing)."""
         self._store.clear()
+        self._attrib_cache.clear()
 
 
 _z_score_tracker: _ZScoreTracker = _ZScoreTracker()
 
+# z² below this (1% of GROUP_THRESHOLD, squared) cannot move attribution in
+# any bucket worth alerting on, so such readings are not stored at all;
+# _attribution_scores() restores them as 0.0 from the bucket's bitmask.
+_TRACK_Z_SQ_FLOOR: float = (_GROUP_THRESHOLD * 0.01) ** 2
+
+
+def _attribution_scores(
+    group_name: str, bitmask: int, z_scores: dict[str, float]
+) -> dict[str, float]:
+    """Return z_scores plus a 0.0 entry for every bitmask member that was not tracked.
+
+    Members below _TRACK_Z_SQ_FLOOR fired in the bucket but were never
+    recorded; they keep their place in attribution_detail with a 0 fraction.
+    """
+    members = CONFIG["SENSOR_GROUPS"].get(group_name, [])
+    scores = dict(z_scores)
+    bitmask &= (1 << len(members)) - 1
+    while bitmask:
+        low = bitmask & -bitmask
+        scores.setdefault(members[low.bit_length() - 1], 0.0)
+        bitmask ^= low
+    return scores
+
 
 # ---------------------------------------------------------------------------
 # Pure-Python math helpers (no external libraries)
 # ---------------------------------------------------------------------------
 
 def _rms(z_scores: list[float]) -> float:
-    """Return the root-mean-square of a list of z-scores (empty list → 0.0)."""
+    """Return the root-mean-square of a list of z-scores (empty list → 0.0).
+
+    math.sumprod runs the dot product in C with no per-element Python frame;
+    for lists this size it is also faster than converting to NumPy and dotting.
+    """
     if not z_scores:
         return 0.0
-    return math.sqrt(sum(z * z for z in z_scores) / len(z_scores))
+    return math.sqrt(math.sumprod(z_scores, z_scores) / len(z_scores))
 
 
-def _sensors_from_bitmask(group_name: str, bitmask: int) -> list[str]:
-    """Return sensor_ids whose bits are set in bitmask for the given group."""
-    members = CONFIG["SENSOR_GROUPS"].get(group_name, [])
-    return [s for i, s in enumerate(members) if bitmask & (1 << i)]
+# Groups up to this size get a full mask → "s1,s3" decode table (2**size
+# strings); larger groups decode by walking the set bits instead.
+_DECODE_TABLE_MAX_SENSORS: int = 10
 
 
-def _missing_from_bitmask(group_name: str, bitmask: int) -> list[str]:
-    """Return sensor_ids whose bits are NOT set in bitmask for the given group."""
-    members = CONFIG["SENSOR_GROUPS"].get(group_name, [])
-    return [s for i, s in enumerate(members) if not (bitmask & (1 << i))]
+def _build_decode_tables(
+    sensor_groups: dict[str, list[str]],
+) -> dict[str, tuple[str, ...]]:
+    """Precompute comma-joined sensor_ids for every bitmask of each small group."""
+    tables: dict[str, tuple[str, ...]] = {}
+    for group_name, members in sensor_groups.items():
+        if len(members) > _DECODE_TABLE_MAX_SENSORS:
+            continue
+        tables[group_name] = tuple(
+            ",".join(s for i, s in enumerate(members) if mask & (1 << i))
+            for mask in range(1 << len(members))
+        )
+    return tables
+
+
+_DECODE_CSV: dict[str, tuple[str, ...]] = _build_decode_tables(CONFIG["SENSOR_GROUPS"])
+
+# group_name → member count, so decoding masks a bitmask without len() on
+# the config list.
+_GROUP_SIZE: dict[str, int] = {gn: len(m) for gn, m in CONFIG["SENSOR_GROUPS"].items()}
 
 
-def _sensor_bit(group_name: str, sensor_id: str) -> int:
-    """Return the bitmask bit for sensor_id within group_name (0 if not found)."""
+def _bitmask_to_csv(group_name: str, bitmask: int) -> str:
+    """Return the comma-separated sensor_ids whose bits are set in bitmask."""
+    bitmask &= (1 << _GROUP_SIZE.get(group_name, 0)) - 1
+    table = _DECODE_CSV.get(group_name)
+    if table is not None:
+        return table[bitmask]
+    return _join_set_bits(group_name, bitmask)
+
+
+@functools.lru_cache(maxsize=4096)
+def _join_set_bits(group_name: str, bitmask: int) -> str:
+    """Walk the set bits of bitmask for a group too large for a decode table.
+
+    Memoised on the (already masked) bitmask: steady-state streams repeat a
+    few firing patterns, so repeats return the same string without a join.
+    """
     members = CONFIG["SENSOR_GROUPS"].get(group_name, [])
-    try:
-        return 1 << members.index(sensor_id)
-    except ValueError:
-        return 0
+    names = []
+    while bitmask:
+        low = bitmask & -bitmask
+        names.append(members[low.bit_length() - 1])
+        bitmask ^= low
+    return ",".join(names)
+
+
+def _build_membership_index(
+    sensor_groups: dict[str, list[str]],
+) -> dict[str, tuple[tuple[str, int, int], ...]]:
+    """Invert sensor_groups into sensor_id → ((group_name, sensor_bit, group_size), ...)."""
+    index: dict[str, list[tuple[str, int, int]]] = {}
+    for group_name, members in sensor_groups.items():
+        for bit_pos, sensor_id in enumerate(members):
+            index.setdefault(sensor_id, []).append((group_name, 1 << bit_pos, len(members)))
+    return {sid: tuple(entries) for sid, entries in index.items()}
+
+
+# Built once at import: one lookup tags a row with all of its groups.
+_MEMBERSHIP: dict[str, tuple[tuple[str, int, int], ...]] = _build_membership_index(
+    CONFIG["SENSOR_GROUPS"]
+)
+
 
+# epoch_ms carried by readings whose timestamp does not parse; their bucket
+# is the raw timestamp itself, so the output falls back to time_bucket.
+_UNPARSED_EPOCH_MS: int = -(2**63)
 
-def _timestamp_bucket(timestamp: str, tolerance_ms: int) -> str:
+
+@functools.lru_cache(maxsize=65536)
+def _timestamp_bucket(timestamp: str, tolerance_ms: int) -> tuple[str, int]:
     """Truncate a timestamp string to SYNC_TOLERANCE_MS granularity for alignment.
 
-    Converts the timestamp to seconds-since-epoch (approximated from string),
-    bins it, and returns the bin start as a string. For Pathway-based use this
-    is replaced by the UDF _udf_time_bucket which operates on the pw column.
+    Parses the timestamp to UTC epoch milliseconds (timeparse fast path),
+    bins it, and returns (bin start formatted with input_time_format,
+    epoch_ms). Memoised: readings within a bucket share a handful of
+    distinct strings. Unparseable or out-of-range timestamps are returned
+    unchanged, paired with _UNPARSED_EPOCH_MS.
+
+    NOTE: timestamps are interpreted as UTC. Earlier versions binned in the
+    host's local time zone, which put bucket edges at local-time offsets
+    and made output depend on the machine's TZ setting.
     """
-    import time as _time
-    import datetime
     try:
-        dt = datetime.datetime.strptime(timestamp, _config_mod.CONFIG.input_time_format)
-        epoch_ms = int(dt.timestamp() * 1000)
-        bucket_ms = (epoch_ms // tolerance_ms) * tolerance_ms
-        bucket_dt = datetime.datetime.fromtimestamp(bucket_ms / 1000)
-        return bucket_dt.strftime(_config_mod.CONFIG.input_time_format)
-    except (ValueError, OSError):
-        return timestamp
+        epoch_ms = parse_input_time(timestamp)
+        return format_input_time(epoch_ms - epoch_ms % tolerance_ms), epoch_ms
+    except (ValueError, OSError, OverflowError):
+        return timestamp, _UNPARSED_EPOCH_MS
 
 
 # ---------------------------------------------------------------------------
@@ -152,64 +282,125 @@ def _timestamp_bucket(timestamp: str, tolerance_ms: int) -> str:
 # ---------------------------------------------------------------------------
 
 @pw.udf
-def _udf_time_bucket(timestamp: str) -> str:
-    """Bin a timestamp string into SYNC_TOLERANCE_MS-wide alignment buckets."""
-    return _timestamp_bucket(timestamp, CONFIG["SYNC_TOLERANCE_MS"])
+def _udf_memberships(sensor_id: str) -> list[tuple[str, int, int]]:
+    """Return every (group_name, sensor_bit, group_size) sensor_id belongs to."""
+    return list(_MEMBERSHIP.get(sensor_id, ()))
 
 
 @pw.udf
-def _udf_composite_score(sum_sq: float, sensor_count: int) -> float:
-    """Compute RMS z-score from the aggregated sum-of-squares and count."""
-    if sensor_count == 0:
-        return 0.0
-    return math.sqrt(sum_sq / sensor_count)
+def _udf_track_z(
+    group_name: str, sensor_id: str, timestamp: str, z_score: float
+) -> tuple[str, int]:
+    """Record z_score in tracker; return (time_bucket, epoch_ms) for the reading."""
+    bucket, epoch_ms = _timestamp_bucket(timestamp, _SYNC_TOLERANCE_MS)
+    if z_score * z_score < _TRACK_Z_SQ_FLOOR:
+        # Quiet reading: keep it out of the tracker, but drop any earlier
+        # (louder) value so the bucket does not attribute to a stale score.
+        _z_score_tracker.discard(group_name, bucket, sensor_id)
+    else:
+        _z_score_tracker.record(group_name, bucket, sensor_id, z_score)
+    return bucket, epoch_ms
+
+
+@pw.udf
+def _udf_epoch_to_str(epoch_ms: int, time_bucket: str) -> str:
+    """Format the bucket's latest epoch_ms back into an input_time_format string."""
+    if epoch_ms == _UNPARSED_EPOCH_MS:
+        return time_bucket
+    return format_input_time(epoch_ms)
 
 
 @pw.udf
 def _udf_contributing_sensors(group_name: str, bitmask: int) -> str:
     """Decode contributing sensor_ids from bitmask into a comma-separated string."""
-    return ",".join(_sensors_from_bitmask(group_name, bitmask))
+    return _bitmask_to_csv(group_name, bitmask)
 
 
 @pw.udf
 def _udf_missing_sensors(group_name: str, bitmask: int) -> str:
     """Decode missing sensor_ids from bitmask into a comma-separated string."""
-    return ",".join(_missing_from_bitmask(group_name, bitmask))
-
-
-@pw.udf
-def _udf_is_group_anomaly(composite_score: float) -> bool:
-    """Return True when composite_score exceeds GROUP_THRESHOLD."""
-    return composite_score > CONFIG["GROUP_THRESHOLD"]
+    return _bitmask_to_csv(group_name, ~bitmask)
 
 
 @pw.udf
-def _udf_top_contributor(group_name: str, time_bucket: str) -> str:
-    """Return the sensor_id with the largest z² fraction for this group-bucket."""
-    z_scores = _z_score_tracker.get(group_name, time_bucket)
+def _udf_attribution_bundle(
+    group_name: str, time_bucket: str, bitmask: int
+) -> tuple[str, str, str]:
+    """Return (top_contributor, attribution_detail, alert_message) for this group-bucket.
+
+    The three fields share one tracker lookup, one fraction pass and one sort.
+    Only called for anomalous buckets (see _derive_composite_columns).
+    Memoised in the tracker until the bucket's z-scores or bitmask change.
+    """
+    cached = _z_score_tracker.cached_attribution(group_name, time_bucket, bitmask)
+    if cached is not None:
+        return cached
+    z_scores = _attribution_scores(
+        group_name, bitmask, _z_score_tracker.get(group_name, time_bucket)
+    )
     fractions = _attribution._compute_fractions(z_scores)
     sorted_pairs = _attribution._sort_descending(fractions)
-    sid, _ = _attribution._top_contributor(sorted_pairs)
-    return sid
+    top_sid, top_frac = _attribution._top_contributor(sorted_pairs)
+    bundle = (
+        top_sid,
+        _attribution._format_attribution_detail(sorted_pairs),
+        _attribution._format_alert_message(group_name, top_sid, top_frac),
+    )
+    _z_score_tracker.cache_attribution(group_name, time_bucket, bitmask, bundle)
+    return bundle
 
 
-@pw.udf
-def _udf_attribution_detail(group_name: str, time_bucket: str) -> str:
-    """Return JSON attribution_detail string for this group-bucket."""
-    z_scores = _z_score_tracker.get(group_name, time_bucket)
-    fractions = _attribution._compute_fractions(z_scores)
-    sorted_pairs = _attribution._sort_descending(fractions)
-    return _attribution._format_attribution_detail(sorted_pairs)
+# ---------------------------------------------------------------------------
+# Bitwise-OR reducer for sensor_bitmask
+# ---------------------------------------------------------------------------
 
+class _BitOrAccumulator(pw.BaseCustomAccumulator):
+    """Accumulate the bitwise OR of sensor_bit values, retraction-safe.
 
-@pw.udf
-def _udf_alert_message(group_name: str, time_bucket: str) -> str:
-    """Return a human-readable alert message for this group-bucket."""
-    z_scores = _z_score_tracker.get(group_name, time_bucket)
-    fractions = _attribution._compute_fractions(z_scores)
-    sorted_pairs = _attribution._sort_descending(fractions)
-    top_sid, top_frac = _attribution._top_contributor(sorted_pairs)
-    return _attribution._format_alert_message(group_name, top_sid, top_frac)
+    Summing bits double-counts a sensor that reports twice in one bucket
+    (the carry flips a neighbouring sensor's bit); OR does not. Each set
+    bit keeps a reference count so a retracted row clears its bit only
+    when no other row in the group still sets it.
+    """
+
+    def __init__(self, bit_counts: dict[int, int]) -> None:
+        """Initialise with a {sensor_bit: rows_setting_it} reference-count map."""
+        self.bit_counts = bit_counts
+
+    @classmethod
+    def neutral(cls) -> _BitOrAccumulator:
+        """Return the empty accumulator (mask 0)."""
+        return cls({})
+
+    @classmethod
+    def from_row(cls, row: list) -> _BitOrAccumulator:
+        """Return an accumulator holding one row's sensor_bit."""
+        [bit] = row
+        return cls({bit: 1})
+
+    def update(self, other: _BitOrAccumulator) -> None:
+        """Merge other in, adding its per-bit reference counts."""
+        for bit, n in other.bit_counts.items():
+            self.bit_counts[bit] = self.bit_counts.get(bit, 0) + n
+
+    def retract(self, other: _BitOrAccumulator) -> None:
+        """Remove other's rows; a bit is cleared once its count reaches zero."""
+        for bit, n in other.bit_counts.items():
+            left = self.bit_counts.get(bit, 0) - n
+            if left > 0:
+                self.bit_counts[bit] = left
+            else:
+                self.bit_counts.pop(bit, None)
+
+    def compute_result(self) -> int:
+        """Return the OR of every bit still referenced."""
+        mask = 0
+        for bit in self.bit_counts:
+            mask |= bit
+        return mask
+
+
+_bit_or = pw.reducers.udf_reducer(_BitOrAccumulator)
 
 
 # ---------------------------------------------------------------------------
@@ -219,77 +410,54 @@ def _udf_alert_message(group_name: str, time_bucket: str) -> str:
 def _build_membership_stream(scored_stream: pw.Table) -> pw.Table | None:
     """Annotate scored_stream with group membership columns; return None if no groups.
 
-    For each (group_name, sensor_id) pair in CONFIG.sensor_groups, filters
-    scored_stream to that sensor, attaches group_name/sensor_bit/group_size/
-    z_score_sq, and records the raw z_score in _z_score_tracker for attribution.
-    The per-sensor filtered streams are concatenated to form one 'exploded' view.
+    One pass over scored_stream: each row is tagged with its (group_name,
+    sensor_bit, group_size) memberships from _MEMBERSHIP and flattened to one
+    row per membership (rows of ungrouped sensors disappear). Each exploded
+    row gets its time_bucket (and z_score_sq, if the input lacks it), and its raw z_score is recorded
+    in _z_score_tracker for attribution.
     """
-    group_streams: list[pw.Table] = []
-
-    for group_name, members in CONFIG["SENSOR_GROUPS"].items():
-        group_size = len(members)
-        for bit_pos, sensor_id in enumerate(members):
-            bit_value = 1 << bit_pos
-
-            @pw.udf
-            def _tag_group(_sid: str, _gn: str = group_name) -> str:
-                """Return the group name constant for this annotated row."""
-                return _gn
-
-            @pw.udf
-            def _tag_bit(_sid: str, _bv: int = bit_value) -> int:
-                """Return the bitmask constant for this sensor in its group."""
-                return _bv
-
-            @pw.udf
-            def _tag_size(_sid: str, _gs: int = group_size) -> int:
-                """Return the group size constant for this annotated row."""
-                return _gs
-
-            @pw.udf
-            def _track_z(
-                timestamp: str,
-                z_score: float,
-                _gn: str = group_name,
-                _sid: str = sensor_id,
-            ) -> str:
-                """Record z_score in tracker; return the time_bucket string."""
-                bucket = _timestamp_bucket(timestamp, CONFIG["SYNC_TOLERANCE_MS"])
-                _z_score_tracker.record(_gn, bucket, _sid, z_score)
-                return bucket
-
-            sensor_stream = (
-                scored_stream
-                .filter(pw.this.sensor_id == sensor_id)
-                .with_columns(
-                    group_name  = _tag_group(pw.this.sensor_id),
-                    sensor_bit  = _tag_bit(pw.this.sensor_id),
-                    group_size  = _tag_size(pw.this.sensor_id),
-                    z_score_sq  = pw.this.z_score * pw.this.z_score,
-                    time_bucket = _track_z(pw.this.timestamp, pw.this.z_score),
-                )
-            )
-            group_streams.append(sensor_stream)
-
-    if not group_streams:
+    if not _MEMBERSHIP:
         logger.warning("No sensor groups configured — group_anomalies will be empty.")
         return None
 
-    return pw.Table.concat_reindex(*group_streams)
+    exploded = scored_stream.with_columns(
+        membership=_udf_memberships(pw.this.sensor_id),
+    ).flatten(pw.this.membership)
+
+    tagged = exploded.with_columns(
+        group_name = pw.this.membership[0],
+        sensor_bit = pw.this.membership[1],
+        group_size = pw.this.membership[2],
+    )
+    if "z_score_sq" not in scored_stream.schema.column_names():
+        # zscore.build_scored_stream emits z_score_sq already; other scored
+        # streams (e.g. detection) only carry z_score.
+        tagged = tagged.with_columns(z_score_sq = pw.this.z_score * pw.this.z_score)
+    tracked = tagged.with_columns(
+        _tracked = _udf_track_z(
+            pw.this.group_name, pw.this.sensor_id, pw.this.timestamp, pw.this.z_score
+        ),
+    )
+    return tracked.with_columns(
+        time_bucket = pw.this._tracked[0],
+        epoch_ms    = pw.this._tracked[1],
+    ).without(pw.this.membership, pw.this._tracked)
 
 
 def _aggregate_by_bucket(membership_stream: pw.Table) -> pw.Table:
-    """Group by (group_name, time_bucket); reduce to RMS inputs and bitmask."""
+    """Group by (group_name, time_bucket); reduce to RMS inputs and OR'd bitmask."""
     return membership_stream.groupby(
         pw.this.group_name,
         pw.this.time_bucket,
     ).reduce(
         group_name     = pw.this.group_name,
         time_bucket    = pw.this.time_bucket,
-        timestamp      = pw.reducers.max(pw.this.timestamp),
+        # Integer max on epoch_ms, not string max on timestamp; formatted
+        # back once per output row in _derive_composite_columns.
+        epoch_ms       = pw.reducers.max(pw.this.epoch_ms),
         sum_sq_zscores = pw.reducers.sum(pw.this.z_score_sq),
         sensor_count   = pw.reducers.count(),
-        sensor_bitmask = pw.reducers.sum(pw.this.sensor_bit),
+        sensor_bitmask = _bit_or(pw.this.sensor_bit),
         group_size     = pw.reducers.max(pw.this.group_size),
     )
 
@@ -297,10 +465,14 @@ def _aggregate_by_bucket(membership_stream: pw.Table) -> pw.Table:
 def _derive_composite_columns(aggregated: pw.Table) -> pw.Table:
     """Derive composite_score, attribution fields, and is_group_anomaly."""
     with_score = aggregated.with_columns(
-        composite_score = _udf_composite_score(
-            pw.this.sum_sq_zscores,
-            pw.this.sensor_count,
-        )
+        timestamp = _udf_epoch_to_str(pw.this.epoch_ms, pw.this.time_bucket),
+        # RMS as a native column expression (no Python UDF call per row).
+        # Groupby buckets always hold >= 1 reading; the if_else only keeps
+        # the old "count 0 → 0.0" contract without risking a division by zero.
+        composite_score = (
+            pw.this.sum_sq_zscores
+            / pw.if_else(pw.this.sensor_count == 0, 1, pw.this.sensor_count)
+        ) ** 0.5,
     )
     with_flags = with_score.with_columns(
         contributing_sensors = _udf_contributing_sensors(
@@ -311,19 +483,29 @@ def _derive_composite_columns(aggregated: pw.Table) -> pw.Table:
             pw.this.group_name,
             pw.this.sensor_bitmask,
         ),
-        is_group_anomaly = _udf_is_group_anomaly(pw.this.composite_score),
+        is_group_anomaly = pw.this.composite_score > _GROUP_THRESHOLD,
     )
-    return with_flags.with_columns(
-        top_contributor    = _udf_top_contributor(
-            pw.this.group_name, pw.this.time_bucket
-        ),
-        attribution_detail = _udf_attribution_detail(
-            pw.this.group_name, pw.this.time_bucket
-        ),
-        alert_message      = _udf_alert_message(
-            pw.this.group_name, pw.this.time_bucket
-        ),
+    # Attribution is only computed for anomalous buckets; the (much larger)
+    # quiet remainder gets constant "" columns and no UDF call at all.
+    hot = with_flags.filter(pw.this.is_group_anomaly).with_columns(
+        _bundle = _udf_attribution_bundle(
+            pw.this.group_name, pw.this.time_bucket, pw.this.sensor_bitmask
+        )
+    )
+    hot = hot.with_columns(
+        top_contributor    = pw.this._bundle[0],
+        attribution_detail = pw.this._bundle[1],
+        alert_message      = pw.this._bundle[2],
+    ).without(pw.this._bundle)
+    cold = with_flags.filter(~pw.this.is_group_anomaly).with_columns(
+        top_contributor    = "",
+        attribution_detail = "",
+        alert_message      = "",
     )
+    # hot and cold are complementary filters of one table, so the row ids
+    # never collide: concat keeps them (concat_reindex would mint new ids).
+    pw.universes.promise_are_pairwise_disjoint(hot, cold)
+    return pw.Table.concat(hot, cold)
 
 
 def _project_output(enriched: pw.Table) -> pw.Table:
@@ -6,7 +6,11 @@ Runs all three anti-cheat detectors on factory data (pandas-based,
 consistent with the backtrack.py approach) and writes results to
 data/alerts/tamper_log.jsonl.
 
-    uv run python src/run_anticheat.py
+The whole batch shares one logged_at stamp and is serialised (orjson when
+installed, stdlib json otherwise) into a single buffer written with one
+write() call. Per-event console lines are printed only with --verbose.
+
+    uv run python src/run_anticheat.py [--verbose]
 """
 
 import json
@@ -14,6 +18,11 @@ import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(ROOT))
 
@@ -24,19 +33,53 @@ _FACTORY_DATA_DIR: str = _cfg.factory_data_directory
 _TAMPER_LOG_PATH:  str = _cfg.tamper_log_path
 
 
-def run_anticheat(factory_dir: str = _FACTORY_DATA_DIR) -> None:
-    """Run all detectors and write tamper_log.jsonl."""
+def _json_default(obj):
+    """Convert numpy scalars and arrays (which json cannot encode) to Python values."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"cannot serialise {type(obj).__name__} to JSON")
+
+
+def _dumps_line(record: dict) -> bytes:
+    """Serialise record as one compact JSON line (bytes, newline-terminated).
+
+    The stdlib fallback matches orjson's output byte for byte: no spaces
+    after separators, raw UTF-8 rather than \\u escapes, numpy values as
+    Python numbers/lists.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            record, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+        )
+    line = json.dumps(
+        record, default=_json_default, separators=(",", ":"), ensure_ascii=False
+    )
+    return (line + "\n").encode("utf-8")
+
+
+def run_anticheat(factory_dir: str = _FACTORY_DATA_DIR, verbose: bool = False) -> None:
+    """Run all detectors and write tamper_log.jsonl.
+
+    Args:
+        factory_dir: Directory of factory CSV feeds to scan.
+        verbose:     Print one console line per tamper event after writing.
+    """
     print("SHIELD AI — Phase 4 Anti-Cheat Engine")
     print(f"  Factory source : {factory_dir}")
     print(f"  Output log     : {_TAMPER_LOG_PATH}\n")
 
     records = run_all_detectors(factory_dir)
 
+    logged_at = datetime.now(tz=timezone.utc).isoformat()
+    for rec in records:
+        rec["logged_at"] = logged_at
+
     Path(_TAMPER_LOG_PATH).parent.mkdir(parents=True, exist_ok=True)
-    with open(_TAMPER_LOG_PATH, "w", encoding="utf-8") as f:
+    with open(_TAMPER_LOG_PATH, "wb") as f:
+        f.write(b"".join(_dumps_line(rec) for rec in records))
+
+    if verbose:
         for rec in records:
-            rec["logged_at"] = datetime.now(tz=timezone.utc).isoformat()
-            f.write(json.dumps(rec) + "\n")
             print(
                 f"[TAMPER] {rec['tamper_type']} | "
                 f"Factory: {rec['factory_id']} | "
@@ -50,5 +93,6 @@ if __name__ == "__main__":
     import argparse
     parser = argparse.ArgumentParser(description="SHIELD AI Phase 4 Anti-Cheat runner")
     parser.add_argument("--factory-dir", default=_FACTORY_DATA_DIR)
+    parser.add_argument("--verbose", action="store_true", help="print each tamper event")
     args = parser.parse_args()
-    run_anticheat(factory_dir=args.factory_dir)
+    run_anticheat(factory_dir=args.factory_dir, verbose=args.verbose)
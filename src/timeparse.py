@@ -0,0 +1,134 @@
+"""
+SHIELD AI — Input Time Parsing
+===============================
+
+Fast parsers for the ``time`` column of every CSV source, specialised once
+for config.CONFIG.input_time_format ("%Y-%m-%d %H:%M" by default).
+
+datetime.strptime re-interprets its format string on every call. Here the
+format is translated into a compiled regex at import, so a parse is one
+regex match plus a few int() conversions. Formats using directives other
+than %Y %m %d %H %M %S fall back to strptime transparently.
+
+All times are treated as UTC and returned as integer epoch milliseconds,
+the unit used by window_duration_ms / sync_tolerance_ms.
+
+Usage
+-----
+    from src.timeparse import format_input_time, parse_input_time, parse_input_time_batch
+
+    epoch_ms = parse_input_time("2026-02-01 08:15")
+    stamps   = parse_input_time_batch(df["time"].to_numpy())
+    text     = format_input_time(epoch_ms)                 # "2026-02-01 08:15"
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+from config import CONFIG as _cfg
+
+if TYPE_CHECKING:
+    import numpy as np
+
+_TIME_FORMAT: str = _cfg.input_time_format
+
+# strptime directive → (regex group, index into the (Y, m, d, H, M, S) tuple)
+_DIRECTIVES: dict[str, tuple[str, int]] = {
+    "%Y": (r"(\d{4})",   0),
+    "%m": (r"(\d{1,2})", 1),
+    "%d": (r"(\d{1,2})", 2),
+    "%H": (r"(\d{1,2})", 3),
+    "%M": (r"(\d{1,2})", 4),
+    "%S": (r"(\d{1,2})", 5),
+}
+
+_EPOCH: datetime = datetime(1970, 1, 1)
+_ONE_MS: timedelta = timedelta(milliseconds=1)
+
+
+# ---------------------------------------------------------------------------
+# Format compilation
+# ---------------------------------------------------------------------------
+
+def _translate_strptime(fmt: str) -> tuple[re.Pattern[str], tuple[int, ...]] | None:
+    """Translate a strptime format into (compiled regex, field slot per group).
+
+    Returns None when fmt uses a directive this fast path does not handle,
+    or omits the year/month/day needed to build a date.
+    """
+    parts: list[str] = []
+    slots: list[int] = []
+    i = 0
+    while i < len(fmt):
+        if fmt[i] != "%":
+            parts.append(re.escape(fmt[i]))
+            i += 1
+            continue
+        directive = fmt[i:i + 2]
+        if directive == "%%":
+            parts.append("%")
+        elif directive in _DIRECTIVES:
+            group, slot = _DIRECTIVES[directive]
+            if slot in slots:
+                return None
+            parts.append(group)
+            slots.append(slot)
+        else:
+            return None
+        i += 2
+    if not {0, 1, 2} <= set(slots):
+        return None
+    return re.compile("".join(parts)), tuple(slots)
+
+
+_COMPILED = _translate_strptime(_TIME_FORMAT)
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def parse_input_time(value: str) -> int:
+    """Parse one input_time_format string into UTC epoch milliseconds.
+
+    Raises:
+        ValueError: If value does not match input_time_format (same contract
+                    as datetime.strptime).
+    """
+    if _COMPILED is None:
+        dt = datetime.strptime(value, _TIME_FORMAT)
+        if dt.tzinfo is not None:
+            dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+        return (dt - _EPOCH) // _ONE_MS
+
+    regex, slots = _COMPILED
+    match = regex.fullmatch(value)
+    if match is None:
+        raise ValueError(
+            f"time data {value!r} does not match format {_TIME_FORMAT!r}"
+        )
+    fields = [1900, 1, 1, 0, 0, 0]
+    for slot, text in zip(slots, match.groups()):
+        fields[slot] = int(text)
+    # datetime() validates field ranges exactly as strptime would.
+    return (datetime(*fields) - _EPOCH) // _ONE_MS
+
+
+def parse_input_time_batch(values) -> np.ndarray:
+    """Parse an array of input_time_format strings into datetime64[ms] (UTC).
+
+    Vectorised through pandas.to_datetime with cache=True, so repeated
+    timestamps (common across factories sharing a cadence) parse once.
+    """
+    import pandas as pd  # deferred — only batch ingest paths need pandas
+
+    parsed = pd.to_datetime(values, format=_TIME_FORMAT, cache=True)
+    return parsed.to_numpy().astype("datetime64[ms]")
+
+
+def format_input_time(epoch_ms: int) -> str:
+    """Format UTC epoch milliseconds back into an input_time_format string."""
+    return (_EPOCH + epoch_ms * _ONE_MS).strftime(_TIME_FORMAT)
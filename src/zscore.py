@@ -5,7 +5,7 @@ SHIELD AI — Per-Channel Rolling Z-Score Anomaly Scorer
 Computes a per-sensor z-score by combining:
   1. windowed_stats.build_windowed_stats()  — Pathway-native sliding window stats
   2. A join of each raw reading against its window's (mean, std)
-  3. UDF-based z-score and anomaly flag computation
+  3. One fused batch UDF computing the z-score and anomaly flag
 
 The rolling statistics (mean, std) are no longer computed inline here.
 They come from the ``windowed_stats`` table, which is built using Pathway's
@@ -41,9 +41,11 @@ from __future__ import annotations
 
 import logging
 
+import numpy as np
 import pathway as pw
 
 from config import CONFIG as _cfg
+import src._hotmath as _hotmath
 import src.windowed_stats as _ws
 
 log = logging.getLogger(__name__)
@@ -58,6 +60,11 @@ CONFIG: dict = {
     "TIME_FORMAT":      _cfg.input_time_format,  # strptime format matching ingest CSVs
 }
 
+# Hot-path copies of CONFIG values, bound once so per-row helpers read a
+# module global instead of a dict lookup on every call.
+_EPSILON:          float = CONFIG["EPSILON"]
+_ZSCORE_THRESHOLD: float = CONFIG["ZSCORE_THRESHOLD"]
+
 
 # ---------------------------------------------------------------------------
 # Output schema
@@ -72,6 +79,7 @@ class ScoredSchema(pw.Schema):
     rolling_mean: float
     rolling_std:  float
     z_score:      float
+    z_score_sq:   float
     is_anomaly:   bool
 
 
@@ -88,35 +96,65 @@ def calculate_zscore(value: float, mean: float, std: float) -> float:
     if not isinstance(value, (int, float)) or not isinstance(mean, (int, float)) or not isinstance(std, (int, float)):
         raise TypeError(f"z-score inputs must be numeric. Received: {type(value)}")
         
-    safe_std = max(std, CONFIG["EPSILON"])
+    safe_std = max(std, _EPSILON)
     return (value - mean) / safe_std
 
 
 def _is_anomaly(z_score: float) -> bool:
     """Return True when |z_score| exceeds ZSCORE_THRESHOLD."""
-    return abs(z_score) > CONFIG["ZSCORE_THRESHOLD"]
+    return abs(z_score) > _ZSCORE_THRESHOLD
+
+
+def zscore_batch(values: np.ndarray, means: np.ndarray, stds: np.ndarray) -> np.ndarray:
+    """Array counterpart of calculate_zscore (same EPSILON floor), float64 in and out."""
+    return _hotmath.zscore_batch(values, means, stds, _EPSILON)
+
+
+def is_anomaly_batch(z_scores: np.ndarray) -> np.ndarray:
+    """Array counterpart of _is_anomaly."""
+    return _hotmath.anomaly_batch(z_scores, _ZSCORE_THRESHOLD)
+
+
+# Array counterpart of _is_anomaly(calculate_zscore(v, m, s)) for callers
+# holding whole batches: flag_anomalies_batch(values, means, stds) -> bool[].
+# JIT-compiled via Numba when installed, NumPy otherwise.
+flag_anomalies_batch = _hotmath.make_zscore_flag(_ZSCORE_THRESHOLD, _EPSILON)
 
 
 # ---------------------------------------------------------------------------
 # Pathway UDFs
 # ---------------------------------------------------------------------------
 
-@pw.udf
-def _udf_zscore(value: float, mean: float, std: float) -> float:
-    """Score one reading relative to its window's rolling distribution."""
-    z = calculate_zscore(value, mean, std)
-    if log.isEnabledFor(logging.DEBUG):
-        log.debug(
-            "z_score computed",
-            extra={"value": value, "mean": round(mean, 4), "z_score": round(z, 4)},
-        )
-    return z
+# Pathway hands the batch UDFs up to this many rows per call, so the array
+# kernels above replace one interpreter round-trip per reading.
+_UDF_BATCH_SIZE: int = 1024
 
 
-@pw.udf
-def _udf_is_anomaly(z_score: float) -> bool:
-    """Return True when the absolute z-score exceeds ZSCORE_THRESHOLD."""
-    return _is_anomaly(z_score)
+@pw.udf(max_batch_size=_UDF_BATCH_SIZE)
+def _udf_zscore_and_flag(
+    values: list[float], means: list[float], stds: list[float]
+) -> list[tuple[float, float, bool]]:
+    """Score a batch of readings; return (z_score, z_score_sq, is_anomaly) per reading.
+
+    One fused call per batch: z² and the anomaly flag are derived from the z
+    array already in hand, instead of later column ops re-reading z_score
+    (multivariate sums z_score_sq directly).
+    """
+    z = zscore_batch(
+        np.asarray(values, dtype=np.float64),
+        np.asarray(means, dtype=np.float64),
+        np.asarray(stds, dtype=np.float64),
+    )
+    flags = is_anomaly_batch(z)
+    z_list = z.tolist()
+    z_sq_list = (z * z).tolist()
+    if log.isEnabledFor(logging.DEBUG):
+        for value, mean, z_i in zip(values, means, z_list):
+            log.debug(
+                "z_score computed",
+                extra={"value": value, "mean": round(mean, 4), "z_score": round(z_i, 4)},
+            )
+    return list(zip(z_list, z_sq_list, flags.tolist()))
 
 
 # ---------------------------------------------------------------------------
@@ -165,21 +203,23 @@ def _join_readings_to_windows(
 
 
 def _score_readings(joined: pw.Table) -> pw.Table:
-    """Attach z_score and is_anomaly columns to the joined reading-window table.
+    """Attach z_score, z_score_sq and is_anomaly columns to the joined reading-window table.
 
     Streaming semantics: each row in ``joined`` is processed independently;
-    z_score and is_anomaly are pure per-row transformations with no state.
+    the scored columns are pure per-row transformations with no state.
     """
-    with_z = joined.with_columns(
-        z_score=_udf_zscore(
+    with_scored = joined.with_columns(
+        _scored=_udf_zscore_and_flag(
             pw.this.value,
             pw.this.rolling_mean,
             pw.this.rolling_std,
         )
     )
-    return with_z.with_columns(
-        is_anomaly=_udf_is_anomaly(pw.this.z_score),
-    )
+    return with_scored.with_columns(
+        z_score    = pw.this._scored[0],
+        z_score_sq = pw.this._scored[1],
+        is_anomaly = pw.this._scored[2],
+    ).without(pw.this._scored)
 
 
 def _project_scored_output(scored: pw.Table) -> pw.Table:
@@ -191,6 +231,7 @@ def _project_scored_output(scored: pw.Table) -> pw.Table:
         pw.this.rolling_mean,
         pw.this.rolling_std,
         pw.this.z_score,
+        pw.this.z_score_sq,
         pw.this.is_anomaly,
     )
 
@@ -206,7 +247,7 @@ def build_scored_stream(factory_stream: pw.Table) -> pw.Table:
       1. Rename factory columns to the generic sensor vocabulary.
       2. Delegate to windowed_stats.build_windowed_stats() for window-level stats.
       3. Join each raw reading back to its window's (mean, std).
-      4. Compute z_score and is_anomaly per reading.
+      4. Compute z_score, z_score_sq and is_anomaly per reading.
       5. Project to ScoredSchema.
 
     Streaming semantics: Pathway processes each factory row as a delta.  The
@@ -221,7 +262,7 @@ def build_scored_stream(factory_stream: pw.Table) -> pw.Table:
     Returns:
         scored_stream — Pathway Table matching ScoredSchema with columns:
             sensor_id, timestamp, value, rolling_mean, rolling_std,
-            z_score, is_anomaly.
+            z_score, z_score_sq, is_anomaly.
     """
     log.info(
         "scoring pipeline building",
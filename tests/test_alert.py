@@ -0,0 +1,104 @@
+import importlib
+import sys
+import types
+import httpx
+import pytest
+
+class _FakeTime:
+    """Stand-in for alert.py's time module: settable monotonic clock, recorded sleeps."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+
+class _ScriptedClient:
+    """httpx.Client stand-in whose post() returns (or raises) the scripted outcomes in order."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.posts = 0
+
+    def post(self, url, json):
+        self.posts += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return httpx.Response(outcome)
+
+    def close(self):
+        pass
+
+@pytest.fixture
+def alert(monkeypatch):
+    """Import src.alert with src.backtrack stubbed, a fake clock, and backoff sleeps at their cap.
+
+    src/backtrack.py is empty in this tree; the webhook classes never call
+    it, so placeholders are enough. The stub and the module are removed
+    afterwards.
+    """
+    backtrack = types.ModuleType("src.backtrack")
+    backtrack.attribute_event = backtrack.build_factory_index = None
+    monkeypatch.setitem(sys.modules, "src.backtrack", backtrack)
+    monkeypatch.delitem(sys.modules, "src.alert", raising=False)
+    module = importlib.import_module("src.alert")
+    monkeypatch.setattr(module, "time", _FakeTime())
+    monkeypatch.setattr(module.random, "uniform", lambda low, high: high)
+    yield module
+    sys.modules.pop("src.alert", None)
+
+def _dispatcher(alert, *outcomes):
+    """Return a _WebhookDispatcher whose HTTP client plays back outcomes (no thread started)."""
+    dispatcher = alert._WebhookDispatcher.__new__(alert._WebhookDispatcher)
+    dispatcher._url = "http://hook.test/"
+    dispatcher._breaker = alert._Breaker(dispatcher._url)
+    dispatcher._client = _ScriptedClient(*outcomes)
+    return dispatcher
+
+def test_breaker_opens_at_threshold_and_probes_after_cooldown(alert):
+    """Verify the circuit opens after the threshold of failures and a post-cooldown success closes it."""
+    breaker = alert._Breaker("http://hook.test/")
+    for _ in range(alert._cfg.webhook_cb_threshold - 1):
+        breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert not breaker.allow()
+    alert.time.now += alert._cfg.webhook_cb_cooldown_seconds
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.fails == 0 and breaker.allow()
+
+def test_token_bucket_limits_burst_and_refills(alert):
+    """Verify the bucket allows a burst, then refuses until tokens refill at the configured rate."""
+    bucket = alert._TokenBucket(rate=2.0, burst=3)
+    assert [bucket.take() for _ in range(4)] == [True, True, True, False]
+    alert.time.now += 0.5  # one token at 2/s
+    assert [bucket.take(), bucket.take()] == [True, False]
+
+def test_deliver_retries_429_and_5xx_with_backoff(alert):
+    """Verify 429 and 503 responses and transport errors are retried with doubling backoff until a 2xx."""
+    dispatcher = _dispatcher(alert, 429, 503, httpx.ConnectError("refused"), 200)
+    dispatcher._deliver({"alert": 1})
+    assert dispatcher._client.posts == 4
+    assert alert.time.sleeps == [1.0, 2.0, 4.0]
+    assert dispatcher._breaker.fails == 0
+
+def test_deliver_does_not_retry_rejected_request(alert):
+    """Verify a non-retryable 4xx is posted once but still counts as a breaker failure."""
+    dispatcher = _dispatcher(alert, 401)
+    dispatcher._deliver({"alert": 1})
+    assert dispatcher._client.posts == 1
+    assert dispatcher._breaker.fails == 1
+
+def test_deliver_stops_retrying_once_circuit_opens(alert):
+    """Verify a persistently failing endpoint gets no more than the retry limit or breaker threshold allows."""
+    attempts = alert._cfg.webhook_max_retries + 1
+    dispatcher = _dispatcher(alert, *[503] * attempts)
+    dispatcher._deliver({"alert": 1})
+    assert dispatcher._client.posts == min(attempts, alert._cfg.webhook_cb_threshold)
+    assert max(alert.time.sleeps) <= alert._cfg.webhook_backoff_max_seconds
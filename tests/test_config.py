@@ -0,0 +1,77 @@
+from config import RISK_BAND_RANK, _Config, validate_config
+import pytest
+
+def test_from_env_defaults():
+    """Verify an empty environment yields the documented defaults."""
+    cfg = _Config.from_env({})
+    assert cfg.window_seconds == 300
+    assert cfg.alert_min_risk_band == "MEDIUM"
+    assert list(cfg.sensor_groups) == ["discharge_point_A"]
+
+def test_from_env_reads_overrides():
+    """Verify scalar and JSON fields are read from the supplied mapping."""
+    cfg = _Config.from_env({"WINDOW_SECONDS": "42", "SENSOR_GROUPS": '{"g": ["s1"]}'})
+    assert cfg.window_seconds == 42
+    assert cfg.sensor_groups == {"g": ["s1"]}
+
+def test_from_env_failure_non_numeric():
+    """Verify ValueError is raised when a numeric override cannot be parsed."""
+    with pytest.raises(ValueError):
+        _Config.from_env({"ZSCORE_THRESHOLD": "high"})
+
+def test_match_sensor_bounds_first_pattern_wins():
+    """Verify precompiled globs resolve in dict order, falling through to '*'."""
+    cfg = _Config.from_env({})
+    assert cfg.match_sensor_bounds("river_ph_01") == (0.0, 14.0)
+    assert cfg.match_sensor_bounds("FACTORY_A") == (-1.0e9, 1.0e9)
+
+def test_match_sensor_bounds_no_match():
+    """Verify None is returned when no configured pattern matches."""
+    cfg = _Config.from_env({"SENSOR_VALUE_RANGE": '{"*ph*": [0.0, 14.0]}'})
+    assert cfg.match_sensor_bounds("FACTORY_A") is None
+
+def test_as_dict_is_cached_and_read_only():
+    """Verify as_dict() returns the same immutable mapping on every call."""
+    cfg = _Config.from_env({})
+    view = cfg.as_dict()
+    assert view is cfg.as_dict()
+    assert view["window_seconds"] == 300
+    assert "sensor_value_range_compiled" not in view
+    with pytest.raises(TypeError):
+        view["window_seconds"] = 1
+
+def test_validate_config_accepts_defaults():
+    """Verify the default configuration passes every validator."""
+    validate_config(_Config.from_env({}))
+
+def test_validate_config_cross_field_rule():
+    """Verify cross-field rules see the whole config."""
+    cfg = _Config.from_env({"WINDOW_DURATION_MS": "5000", "WINDOW_HOP_MS": "5000"})
+    with pytest.raises(ValueError, match="window_duration_ms"):
+        validate_config(cfg)
+
+def test_validate_config_item_rule():
+    """Verify per-entry dict rules report the offending key."""
+    cfg = _Config.from_env({"SENSOR_VALUE_RANGE": '{"*ph*": [14.0, 0.0]}'})
+    with pytest.raises(ValueError, match=r"sensor_value_range\['\*ph\*'\] min"):
+        validate_config(cfg)
+
+def test_alert_min_risk_band_rank():
+    """Verify the minimum alert band is pre-resolved to its integer rank."""
+    assert _Config.from_env({}).alert_min_risk_band_rank == RISK_BAND_RANK["MEDIUM"]
+    assert _Config.from_env({"ALERT_MIN_RISK_BAND": "critical"}).alert_min_risk_band_rank == 3
+
+def test_validate_config_attribution_bucket_within_asof_tolerance():
+    """Verify attribution buckets wider than the as-of tolerance are rejected."""
+    cfg = _Config.from_env({"ATTRIBUTION_BUCKET_SECONDS": "300", "ASOF_TOLERANCE_SECONDS": "120"})
+    with pytest.raises(ValueError, match="must not exceed asof_tolerance_seconds"):
+        validate_config(cfg)
+
+def test_validate_config_reports_item_rules_in_table_order():
+    """Verify dict-entry rules run at their table position, entry by entry."""
+    cfg = _Config.from_env({
+        "SENSOR_VALUE_RANGE": '{"a*": [14.0, 0.0], "b*": "bad"}',
+        "COD_BASELINE": "0",
+    })
+    with pytest.raises(ValueError, match=r"sensor_value_range\['a\*'\] min"):
+        validate_config(cfg)
@@ -0,0 +1,23 @@
+from src.eri import eri_to_band, eri_to_band_rank
+import numpy as np
+import pytest
+
+def test_eri_to_band_happy_path():
+    """Verify each default threshold interval maps to its band."""
+    bands = eri_to_band(np.array([1.0, 3.0, 6.5, 12.0]))
+    assert bands.tolist() == ["LOW", "MEDIUM", "HIGH", "CRITICAL"]
+
+def test_eri_to_band_edge_case_boundaries():
+    """Verify a value equal to a threshold falls into the upper band."""
+    assert eri_to_band_rank(np.array([2.0, 5.0, 10.0])).tolist() == [1, 2, 3]
+
+def test_eri_to_band_scalar_input():
+    """Verify scalar ERI values are accepted as well as arrays."""
+    assert eri_to_band(0.5) == "LOW"
+
+def test_eri_to_band_rejects_nan():
+    """Verify a NaN ERI raises instead of being banded as CRITICAL."""
+    with pytest.raises(ValueError):
+        eri_to_band_rank(np.array([1.0, np.nan]))
+    with pytest.raises(ValueError):
+        eri_to_band(float("nan"))
@@ -0,0 +1,56 @@
+from src.evidence_chain import (
+    GENESIS_HASH, chain_frame, chain_record, last_hash, read_evidence_log, truncate_partial_tail,
+    verify_evidence_log,
+)
+import pytest
+
+def _write_chain(path, records):
+    prev = GENESIS_HASH
+    with open(path, "wb") as fh:
+        for record in records:
+            line, prev = chain_record(prev, record)
+            fh.write(line)
+    return prev
+
+def test_chain_verifies_and_resumes(tmp_path):
+    """Verify an intact chain passes and last_hash() returns its tip."""
+    path = tmp_path / "evidence_log.jsonl"
+    tip = _write_chain(path, [{"cetp_cod": 210.0}, {"cetp_cod": 220.0}])
+    assert verify_evidence_log(str(path))
+    assert last_hash(str(path)) == tip
+    assert last_hash(str(tmp_path / "missing.jsonl")) == GENESIS_HASH
+
+def test_edited_line_breaks_chain(tmp_path):
+    """Verify editing one field of an earlier record fails verification."""
+    path = tmp_path / "evidence_log.jsonl"
+    _write_chain(path, [{"cetp_cod": 210.0}, {"cetp_cod": 220.0}])
+    path.write_bytes(path.read_bytes().replace(b"210.0", b"110.0"))
+    assert not verify_evidence_log(str(path))
+
+def test_msgpack_frames_chain_and_read_back(tmp_path):
+    """Verify msgpack frames verify, resume and decode like the JSONL format."""
+    pytest.importorskip("msgpack")
+    path = tmp_path / "evidence_log.bin"
+    prev = GENESIS_HASH
+    with open(path, "wb") as fh:
+        for record in [{"cetp_cod": 210.0}, {"cetp_cod": 220.0}]:
+            frame, prev = chain_frame(prev, record)
+            fh.write(frame)
+    assert verify_evidence_log(str(path), fmt="msgpack")
+    assert last_hash(str(path), fmt="msgpack") == prev
+    assert [r["cetp_cod"] for r in read_evidence_log(str(path), fmt="msgpack")] == [210.0, 220.0]
+
+def test_partial_last_line_is_skipped_and_truncated(tmp_path):
+    """Verify a crash-truncated last line is ignored on resume and cut before appending."""
+    path = tmp_path / "evidence_log.jsonl"
+    tip = _write_chain(path, [{"cetp_cod": 210.0}, {"cetp_cod": 220.0}])
+    intact = path.read_bytes()
+    path.write_bytes(intact + b'{"cetp_cod":230.0,"prev_ha')
+    assert last_hash(str(path)) == tip
+    assert truncate_partial_tail(str(path)) == len(b'{"cetp_cod":230.0,"prev_ha')
+    assert path.read_bytes() == intact
+    assert truncate_partial_tail(str(path)) == 0
+    line, _ = chain_record(last_hash(str(path)), {"cetp_cod": 230.0})
+    with open(path, "ab") as fh:
+        fh.write(line)
+    assert verify_evidence_log(str(path))
@@ -0,0 +1,57 @@
+import importlib
+import sys
+import types
+import pytest
+
+@pytest.fixture
+def instrumentation(monkeypatch):
+    """Import src.instrumentation with src.metrics stubbed and a fake wall clock at 1000.0.
+
+    Only the timeline store is exercised here, so the metrics classes are
+    placeholders; the stub and the imported module are removed afterwards.
+    """
+    metrics = types.ModuleType("src.metrics")
+    metrics.LatencyCollector = metrics.MetricsReporter = lambda *args, **kwargs: None
+    metrics.format_latency_summary = lambda *args, **kwargs: ""
+    monkeypatch.setitem(sys.modules, "src.metrics", metrics)
+    monkeypatch.delitem(sys.modules, "src.instrumentation", raising=False)
+    module = importlib.import_module("src.instrumentation")
+    module.now = 1000.0
+    monkeypatch.setattr(module, "_wall_clock", lambda: module.now)
+    yield module
+    sys.modules.pop("src.instrumentation", None)
+
+def test_timeline_store_grows_past_initial_capacity(instrumentation):
+    """Verify recording more events than the capacity doubles the array and keeps every stamp."""
+    store = instrumentation._TimelineStore(capacity=2, ttl_seconds=60.0)
+    for i in range(5):
+        instrumentation.now = 1000.0 + i
+        store.record(f"e{i}", instrumentation.STAGE_INGESTION)
+    assert store._ts.shape[0] == 8
+    assert [store.get_stage_time(f"e{i}", instrumentation.STAGE_INGESTION) for i in range(5)] == [
+        1000.0, 1001.0, 1002.0, 1003.0, 1004.0,
+    ]
+
+def test_timeline_store_evicts_events_past_ttl(instrumentation):
+    """Verify an event older than the TTL is evicted on a later record(), a newer one is kept."""
+    store = instrumentation._TimelineStore(capacity=4, ttl_seconds=10.0)
+    store.record("old", instrumentation.STAGE_INGESTION)
+    instrumentation.now += 5.0
+    store.record("new", instrumentation.STAGE_INGESTION)
+    instrumentation.now += 6.0  # "old" is now 11 s old, "new" 6 s
+    store.record("trigger", instrumentation.STAGE_INGESTION)
+    assert store.pop("old") is None
+    assert store.get_stage_time("new", instrumentation.STAGE_INGESTION) == 1005.0
+    assert store._free == []  # the evicted row went straight to "trigger"
+
+def test_timeline_store_reuses_row_after_pop(instrumentation):
+    """Verify pop() returns the stamps and frees the row, which the next event reuses zeroed."""
+    store = instrumentation._TimelineStore(capacity=2, ttl_seconds=60.0)
+    store.record("a", instrumentation.STAGE_INGESTION)
+    instrumentation.now += 0.5
+    store.record("a", instrumentation.STAGE_ALERT)
+    assert store.pop("a") == (1000.0, 0.0, 0.0, 1000.5)
+    store.record("b", instrumentation.STAGE_INGESTION)
+    assert store._idx["b"][0] == 0
+    assert store._next_row == 1
+    assert store.get_stage_time("b", instrumentation.STAGE_ALERT) == 0.0
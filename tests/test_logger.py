@@ -0,0 +1,29 @@
+from src.logger import attach_console_buffer
+import logging
+import pytest
+import time
+
+@pytest.fixture
+def isolated_logger():
+    """Yield a fresh logger outside the hierarchy, so no ancestor handler (e.g. pytest's) is seen."""
+    logger = logging.Logger("shield.test_console_buffer")
+    yield logger
+    for handler in logger.handlers:
+        handler.close()
+
+def test_attach_console_buffer_flushes_periodically(isolated_logger, capsys, monkeypatch):
+    """Verify buffered lines reach stdout on the timer, without a further record."""
+    monkeypatch.setattr("src.logger.CONSOLE_LOG_FLUSH_SECONDS", 0.05)
+    logger = attach_console_buffer(isolated_logger)
+    attach_console_buffer(logger)
+    assert len(logger.handlers) == 1 and logger.propagate
+    logger.info("ALERT %s", "x")
+    time.sleep(0.3)
+    assert capsys.readouterr().out == "ALERT x\n"
+
+def test_attach_console_buffer_skips_configured_logging(isolated_logger):
+    """Verify nothing is attached when an ancestor already has a handler."""
+    child = logging.Logger("shield.test_console_buffer.child")
+    child.parent = isolated_logger
+    isolated_logger.addHandler(logging.NullHandler())
+    assert attach_console_buffer(child).handlers == []
@@ -0,0 +1,25 @@
+from src.metrics_aggregator import emit_metrics
+import json
+import pytest
+
+def test_emit_metrics_happy_path(tmp_path):
+    """Verify the payload is written and the parent directory is created."""
+    path = tmp_path / "alerts" / "pipeline_metrics.json"
+    emit_metrics({"events_processed": 3}, str(path))
+    assert json.loads(path.read_text()) == {"events_processed": 3}
+
+def test_emit_metrics_replaces_without_leftovers(tmp_path):
+    """Verify a second emit replaces the file and leaves no temp file behind."""
+    path = tmp_path / "pipeline_metrics.json"
+    emit_metrics({"v": 1}, str(path))
+    emit_metrics({"v": 2}, str(path))
+    assert json.loads(path.read_text()) == {"v": 2}
+    assert [p.name for p in tmp_path.iterdir()] == ["pipeline_metrics.json"]
+
+def test_emit_metrics_failure_removes_temp_file(tmp_path):
+    """Verify a failed swap re-raises and leaves no temp file behind."""
+    path = tmp_path / "pipeline_metrics.json"
+    path.mkdir()  # os.replace() of a file onto a directory fails
+    with pytest.raises(OSError):
+        emit_metrics({"events_processed": 1}, str(path))
+    assert [p.name for p in tmp_path.iterdir()] == ["pipeline_metrics.json"]
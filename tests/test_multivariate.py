@@ -0,0 +1,61 @@
+from src.multivariate import (
+    _UNPARSED_EPOCH_MS, _aggregate_by_bucket, _attribution_scores, _build_membership_stream,
+    _timestamp_bucket, _z_score_tracker,
+)
+import pathway as pw
+import time
+
+def _final_bitmask(markdown):
+    readings = pw.debug.table_from_markdown(markdown)
+    aggregated = _aggregate_by_bucket(_build_membership_stream(readings))
+    [bitmask] = pw.debug.table_to_pandas(aggregated)["sensor_bitmask"].tolist()
+    return bitmask
+
+def test_bit_or_reducer_counts_duplicate_sensor_once():
+    """Verify a sensor reporting twice in one bucket sets only its own bit."""
+    assert _final_bitmask("""
+        sensor_id | timestamp | z_score
+        FACTORY_A | T1        | 0.5
+        FACTORY_A | T1        | 0.6
+        FACTORY_B | T1        | 0.7
+    """) == 0b0011
+
+def test_bit_or_reducer_retraction_keeps_shared_bit():
+    """Verify retracting one of two rows for a sensor keeps its bit; retracting the last clears it."""
+    assert _final_bitmask("""
+        id | sensor_id | timestamp | z_score | __time__ | __diff__
+        1  | FACTORY_A | T1        | 0.5     | 2        | 1
+        2  | FACTORY_A | T1        | 0.6     | 2        | 1
+        3  | FACTORY_B | T1        | 0.7     | 2        | 1
+        1  | FACTORY_A | T1        | 0.5     | 4        | -1
+        3  | FACTORY_B | T1        | 0.7     | 4        | -1
+    """) == 0b0001
+
+def test_timestamp_bucket_bins_in_utc(monkeypatch):
+    """Verify buckets are aligned to UTC epoch multiples regardless of the host time zone."""
+    monkeypatch.setenv("TZ", "Asia/Kolkata")  # +05:30 would shift local-time bins
+    time.tzset()
+    _timestamp_bucket.cache_clear()
+    try:
+        assert _timestamp_bucket("1970-01-01 01:59", 3_600_000) == ("1970-01-01 01:00", 7_140_000)
+        assert _timestamp_bucket("not a time", 3_600_000) == ("not a time", _UNPARSED_EPOCH_MS)
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+
+def test_quiet_reading_discards_tracked_score_and_attributes_zero():
+    """Verify a quiet update drops the sensor's stored z-score but keeps it in attribution at 0.0."""
+    _z_score_tracker.reset_all()
+    bitmask = _final_bitmask("""
+        id | sensor_id | timestamp | z_score | __time__ | __diff__
+        1  | FACTORY_A | T1        | 4.0     | 2        | 1
+        2  | FACTORY_B | T1        | 3.0     | 2        | 1
+        1  | FACTORY_A | T1        | 4.0     | 4        | -1
+        1  | FACTORY_A | T1        | 0.0     | 4        | 1
+    """)
+    tracked = _z_score_tracker.get("discharge_point_A", "T1")
+    assert tracked == {"FACTORY_B": 3.0}
+    assert _attribution_scores("discharge_point_A", bitmask, tracked) == {
+        "FACTORY_A": 0.0, "FACTORY_B": 3.0,
+    }
+    _z_score_tracker.reset_all()
@@ -0,0 +1,23 @@
+from src.timeparse import format_input_time, parse_input_time, parse_input_time_batch
+import numpy as np
+import pytest
+
+def test_parse_input_time_happy_path():
+    """Verify a default-format timestamp parses to UTC epoch milliseconds."""
+    assert parse_input_time("2026-02-01 08:15") == 1769933700000
+
+def test_parse_input_time_batch_matches_scalar():
+    """Verify the vectorised parser agrees with the scalar one."""
+    values = np.array(["2026-02-01 08:15", "2026-02-01 08:16"])
+    result = parse_input_time_batch(values)
+    assert result.dtype == np.dtype("datetime64[ms]")
+    assert result.astype(np.int64).tolist() == [parse_input_time(v) for v in values]
+
+def test_parse_input_time_failure_bad_field():
+    """Verify out-of-range fields are rejected like strptime does."""
+    with pytest.raises(ValueError):
+        parse_input_time("2026-13-01 08:15")
+
+def test_format_input_time_round_trip():
+    """Verify formatting an epoch-ms value reproduces the parsed string."""
+    assert format_input_time(parse_input_time("2026-02-01 08:15")) == "2026-02-01 08:15"
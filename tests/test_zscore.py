@@ -14,3 +14,24 @@ def test_calculate_zscore_failure_string_input():
     """Verify TypeError is raised when inputting non-numeric types."""
     with pytest.raises(TypeError):
         calculate_zscore(value="high", mean=100, std=25)
+
+def test_flag_anomalies_batch_matches_scalar_path():
+    """Verify the batch kernel agrees with calculate_zscore + _is_anomaly."""
+    import numpy as np
+    from src.zscore import _is_anomaly, flag_anomalies_batch
+    values = np.array([150.0, 100.0, 176.0, 20.0])
+    means  = np.array([100.0, 100.0, 100.0, 100.0])
+    stds   = np.array([25.0, 0.0, 25.0, 25.0])
+    expected = [_is_anomaly(calculate_zscore(v, m, s)) for v, m, s in zip(values, means, stds)]
+    assert flag_anomalies_batch(values, means, stds).tolist() == expected
+
+def test_zscore_batch_matches_scalar_path():
+    """Verify zscore_batch / is_anomaly_batch agree with the scalar helpers."""
+    import numpy as np
+    from src.zscore import _is_anomaly, is_anomaly_batch, zscore_batch
+    values = np.array([150.0, 100.0, 176.0, 20.0])
+    means  = np.array([100.0, 100.0, 100.0, 100.0])
+    stds   = np.array([25.0, 0.0, 25.0, 25.0])
+    z = zscore_batch(values, means, stds)
+    assert z.tolist() == [calculate_zscore(v, m, s) for v, m, s in zip(values, means, stds)]
+    assert is_anomaly_batch(z).tolist() == [_is_anomaly(x) for x in z.tolist()]
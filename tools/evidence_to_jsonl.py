@@ -0,0 +1,54 @@
+"""
+SHIELD AI — Evidence Log Converter
+===================================
+
+Converts a msgpack evidence log (ALERT_LOG_FORMAT=msgpack) into JSONL for
+tooling that expects one JSON object per line. Each output line carries the
+record's prev_hash and hash fields unchanged.
+
+The output is for reading only: its bytes differ from the msgpack frames
+the hashes were computed over, so verify the original with
+src.evidence_chain.verify_evidence_log(path, fmt="msgpack").
+
+Usage
+-----
+    python -m tools.evidence_to_jsonl data/alerts/evidence_log.bin > evidence_log.jsonl
+    python -m tools.evidence_to_jsonl data/alerts/evidence_log.bin -o evidence_log.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+
+from src.evidence_chain import read_evidence_log
+
+
+def convert(src_path: str, out) -> int:
+    """Write every record of the msgpack log at src_path to out as JSONL; return the count."""
+    count = 0
+    for record in read_evidence_log(src_path, fmt="msgpack"):
+        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        count += 1
+    return count
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1].strip())
+    parser.add_argument("log", help="msgpack evidence log to convert")
+    parser.add_argument("-o", "--output", help="output JSONL path (default: stdout)")
+    args = parser.parse_args(argv)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as out:
+            count = convert(args.log, out)
+    else:
+        count = convert(args.log, sys.stdout)
+    print(f"Converted {count} records", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())